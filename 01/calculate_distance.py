@@ -1,9 +1,13 @@
 import sys
 
-def calculate_total_distance_from_file(file_path):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only needed for --numpy
+    np = None
+
+def parse_input(file_path):
     """
-    Reads pairs of numbers from a file, sorts the lists,
-    and calculates the total distance between paired numbers.
+    Reads pairs of numbers from a file into a left and a right list.
     """
     left_list = []
     right_list = []
@@ -15,6 +19,27 @@ def calculate_total_distance_from_file(file_path):
             left_list.append(left)
             right_list.append(right)
     
+    return left_list, right_list
+
+def parse_input_numpy(file_path):
+    """
+    Reads pairs of numbers from a file into a left and a right NumPy array
+    with a single bulk parse of the whole file.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the --numpy mode")
+
+    # Parse all whitespace-separated numbers at once; the columns alternate
+    values = np.fromfile(file_path, dtype=np.int64, sep=' ')
+    if len(values) % 2:
+        raise ValueError("Expected pairs of numbers on every line")
+    pairs = values.reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+def calculate_total_distance(left_list, right_list):
+    """
+    Sorts the lists and calculates the total distance between paired numbers.
+    """
     # Sort both lists
     left_sorted = sorted(left_list)
     right_sorted = sorted(right_list)
@@ -24,17 +49,35 @@ def calculate_total_distance_from_file(file_path):
     
     return total_distance
 
+def calculate_total_distance_numpy(left_array, right_array):
+    """
+    Vectorized variant of calculate_total_distance for NumPy arrays.
+    """
+    return int(np.abs(np.sort(left_array) - np.sort(right_array)).sum())
+
+def calculate_total_distance_from_file(file_path, use_numpy=False):
+    """
+    Reads pairs of numbers from a file, sorts the lists,
+    and calculates the total distance between paired numbers.
+    With use_numpy, the file is parsed and processed as NumPy arrays.
+    """
+    if use_numpy:
+        return calculate_total_distance_numpy(*parse_input_numpy(file_path))
+    left_list, right_list = parse_input(file_path)
+    return calculate_total_distance(left_list, right_list)
+
 def main():
     # Ensure the user provided a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python calculate_distance.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != '--numpy'):
+        print("Usage: python calculate_distance.py <input_file> [--numpy]")
         sys.exit(1)
     
     file_path = sys.argv[1]
+    use_numpy = len(sys.argv) == 3
     
     try:
         # Calculate the total distance
-        total_distance = calculate_total_distance_from_file(file_path)
+        total_distance = calculate_total_distance_from_file(file_path, use_numpy)
         print(f"The total distance between the two lists is: {total_distance}")
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
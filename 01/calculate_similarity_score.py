@@ -1,10 +1,14 @@
 from collections import Counter
 import sys
 
-def calculate_similarity_score_from_file(file_path):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only needed for --numpy
+    np = None
+
+def parse_input(file_path):
     """
-    Reads pairs of numbers from a file, calculates the total similarity score
-    by multiplying each number in the left list by the number of times it appears in the right list.
+    Reads pairs of numbers from a file into a left and a right list.
     """
     left_list = []
     right_list = []
@@ -16,6 +20,28 @@ def calculate_similarity_score_from_file(file_path):
             left_list.append(left)
             right_list.append(right)
     
+    return left_list, right_list
+
+def parse_input_numpy(file_path):
+    """
+    Reads pairs of numbers from a file into a left and a right NumPy array
+    with a single bulk parse of the whole file.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the --numpy mode")
+
+    # Parse all whitespace-separated numbers at once; the columns alternate
+    values = np.fromfile(file_path, dtype=np.int64, sep=' ')
+    if len(values) % 2:
+        raise ValueError("Expected pairs of numbers on every line")
+    pairs = values.reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+def calculate_similarity_score(left_list, right_list):
+    """
+    Multiplies each number in the left list by the number of times
+    it appears in the right list and sums the results.
+    """
     # Count occurrences in the right list
     right_count = Counter(right_list)
     
@@ -24,17 +50,116 @@ def calculate_similarity_score_from_file(file_path):
     
     return similarity_score
 
+def calculate_similarity_score_numpy(left_array, right_array):
+    """
+    Vectorized variant of calculate_similarity_score for NumPy arrays.
+    The right array is reduced to its sorted distinct values with their counts,
+    and each left number is looked up there with a binary search.
+    """
+    values, counts = np.unique(right_array, return_counts=True)
+    if len(values) == 0:
+        return 0
+
+    # Index of each left number among the distinct right values (if present)
+    positions = np.searchsorted(values, left_array)
+    positions[positions == len(values)] = 0
+    found = values[positions] == left_array
+
+    return int((left_array[found] * counts[positions[found]]).sum())
+
+def count_pairs_from_stream(stream, chunk_size=1 << 16):
+    """
+    Reads whitespace-separated pairs of numbers from a text stream in chunks
+    and counts the occurrences of each number in the left and the right column.
+    Only the two frequency tables are kept, so memory grows with the number of
+    distinct values, not with the number of rows.
+    """
+    left_count = Counter()
+    right_count = Counter()
+    carry = ''
+    is_left = True  # Whether the next complete number belongs to the left column
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        numbers = (carry + chunk).split()
+        # A number at the very end of the chunk may continue in the next one
+        carry = numbers.pop() if numbers and not chunk[-1].isspace() else ''
+
+        left_start = 0 if is_left else 1
+        left_count.update(map(int, numbers[left_start::2]))
+        right_count.update(map(int, numbers[1 - left_start::2]))
+        if len(numbers) % 2:
+            is_left = not is_left
+
+    if carry:
+        (left_count if is_left else right_count)[int(carry)] += 1
+        is_left = not is_left
+    if not is_left:
+        raise ValueError("Expected pairs of numbers on every line")
+
+    return left_count, right_count
+
+def count_pairs(pairs):
+    """
+    Counts the occurrences of each number in the left and the right column
+    of an iterable of (left, right) pairs, e.g. a generator.
+    """
+    left_count = Counter()
+    right_count = Counter()
+    for left, right in pairs:
+        left_count[left] += 1
+        right_count[right] += 1
+    return left_count, right_count
+
+def calculate_similarity_score_from_counts(left_count, right_count):
+    """
+    Calculates the similarity score from the frequency tables of both lists:
+    every value v contributes v * left_count[v] * right_count[v].
+    """
+    if len(right_count) < len(left_count):
+        left_count, right_count = right_count, left_count
+    return sum(value * count * right_count[value] for value, count in left_count.items())
+
+def calculate_similarity_score_from_stream(stream):
+    """
+    Calculates the similarity score of a text stream (e.g. an open file or
+    sys.stdin) in constant memory with respect to the number of rows.
+    """
+    return calculate_similarity_score_from_counts(*count_pairs_from_stream(stream))
+
+def calculate_similarity_score_from_file(file_path, use_numpy=False):
+    """
+    Reads pairs of numbers from a file, calculates the total similarity score
+    by multiplying each number in the left list by the number of times it appears in the right list.
+    With use_numpy, the file is parsed and processed as NumPy arrays.
+    """
+    if use_numpy:
+        return calculate_similarity_score_numpy(*parse_input_numpy(file_path))
+    left_list, right_list = parse_input(file_path)
+    return calculate_similarity_score(left_list, right_list)
+
 def main():
     # Ensure the user provided a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python calculate_similarity_score.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] not in ('--numpy', '--stream')):
+        print("Usage: python calculate_similarity_score.py <input_file|-> [--numpy|--stream]")
         sys.exit(1)
     
     file_path = sys.argv[1]
+    mode = sys.argv[2] if len(sys.argv) == 3 else None
     
     try:
         # Calculate the similarity score
-        similarity_score = calculate_similarity_score_from_file(file_path)
+        if file_path == '-':
+            # Input piped through stdin is always streamed
+            similarity_score = calculate_similarity_score_from_stream(sys.stdin)
+        elif mode == '--stream':
+            with open(file_path, 'r') as file:
+                similarity_score = calculate_similarity_score_from_stream(file)
+        else:
+            similarity_score = calculate_similarity_score_from_file(file_path, mode == '--numpy')
         print(f"The similarity score between the two lists is: {similarity_score}")
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
@@ -1,3 +1,8 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only needed for --numpy
+    np = None
+
 MIN_DIFF = 1
 MAX_DIFF = 3
 
@@ -15,12 +20,60 @@ def is_safe_report(report):
            all(-MAX_DIFF <= diff <= -MIN_DIFF for diff in differences)
 
 
-def count_safe_reports(file_path):
+def parse_reports(file_path):
     """
-    Reads reports from a file and counts how many are safe.
+    Reads reports from a file, one list of levels per line.
+    """
+    with open(file_path, 'r') as file:
+        return [list(map(int, line.split())) for line in file]
+
+
+def parse_reports_matrix(file_path):
+    """
+    Reads all reports into a zero-padded integer matrix (one row per report)
+    and an array with the number of levels of each report.
     """
+    if np is None:
+        raise ImportError("NumPy is required for the --numpy mode")
+
     with open(file_path, 'r') as file:
-        reports = [list(map(int, line.split())) for line in file]
+        text = file.read()
+
+    lengths = np.array([len(line.split()) for line in text.splitlines()], dtype=np.int64)
+    values = np.fromstring(text, dtype=np.int64, sep=' ')
+    if len(values) != lengths.sum():
+        raise ValueError("Reports must contain whitespace-separated integers only")
+
+    # Scatter the flat values into their rows; shorter rows keep the zero padding
+    levels = np.zeros((len(lengths), lengths.max(initial=0)), dtype=np.int64)
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    columns = np.arange(len(values)) - np.repeat(starts, lengths)
+    levels[rows, columns] = values
+    return levels, lengths
+
+
+def safe_rows(levels, lengths):
+    """
+    Vectorized is_safe_report for every row of a padded level matrix.
+    Steps past the end of a report are masked out and count as valid.
+    """
+    differences = np.diff(levels, axis=1)
+    padding = np.arange(differences.shape[1]) >= (lengths - 1)[:, None]
+
+    increasing = ((differences >= MIN_DIFF) & (differences <= MAX_DIFF)) | padding
+    decreasing = ((differences >= -MAX_DIFF) & (differences <= -MIN_DIFF)) | padding
+    return increasing.all(axis=1) | decreasing.all(axis=1)
+
+
+def count_safe_reports(file_path, use_numpy=False):
+    """
+    Reads reports from a file and counts how many are safe.
+    With use_numpy, all reports are evaluated at once as a NumPy matrix.
+    """
+    if use_numpy:
+        return int(safe_rows(*parse_reports_matrix(file_path)).sum())
+    reports = parse_reports(file_path)
     return sum(is_safe_report(report) for report in reports)
 
 
@@ -28,15 +81,16 @@ def main():
     import sys
 
     # Ensure the user provides a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python count_safe_reports.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != '--numpy'):
+        print("Usage: python count_safe_reports.py <input_file> [--numpy]")
         sys.exit(1)
 
     file_path = sys.argv[1]
+    use_numpy = len(sys.argv) == 3
 
     try:
         # Count safe reports
-        safe_count = count_safe_reports(file_path)
+        safe_count = count_safe_reports(file_path, use_numpy)
         print(f"The number of safe reports is: {safe_count}")
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
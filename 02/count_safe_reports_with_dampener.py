@@ -1,3 +1,8 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only needed for --numpy
+    np = None
+
 MIN_DIFF = 1
 MAX_DIFF = 3
 
@@ -15,46 +20,135 @@ def is_safe_report(report):
            all(-MAX_DIFF <= diff <= -MIN_DIFF for diff in differences)
 
 
+def find_unsafe_step(report, direction, skip=None):
+    """
+    Walks the report once, ignoring the level at index `skip`, and returns the
+    indices (previous, current) of the first adjacent pair whose difference is
+    not a valid step in `direction` (1 = increasing, -1 = decreasing).
+    Returns None if every step is valid.
+    """
+    previous = None
+    for index, level in enumerate(report):
+        if index == skip:
+            continue
+        if previous is not None and not MIN_DIFF <= (level - report[previous]) * direction <= MAX_DIFF:
+            return previous, index
+        previous = index
+    return None
+
+
 def is_safe_report_with_dampener(report):
     """
     Checks if a single report is safe considering the Problem Dampener:
     - The report is safe if it's valid by the original rules.
     - If not, removing a single level from the report makes it safe.
-    """
-    if is_safe_report(report):
-        return True
 
-    # Try removing each level one at a time and check if the report becomes safe
-    for i in range(len(report)):
-        modified_report = report[:i] + report[i + 1:]
-        if is_safe_report(modified_report):
+    For each direction only the first invalid step matters: a removal that
+    leaves both of its levels in place cannot fix it, so only those two
+    levels are candidates. This keeps the check linear in the report length.
+    """
+    for direction in (1, -1):
+        unsafe_step = find_unsafe_step(report, direction)
+        if unsafe_step is None:
+            return True
+        if any(find_unsafe_step(report, direction, skip) is None for skip in unsafe_step):
             return True
 
     return False
 
 
-def count_safe_reports_with_dampener(file_path):
+def check_reports_with_dampener(reports):
     """
-    Reads reports from a file and counts how many are safe considering the Problem Dampener.
+    Evaluates many reports at once and returns whether each one is safe
+    considering the Problem Dampener.
+    """
+    return [is_safe_report_with_dampener(report) for report in reports]
+
+
+def parse_reports(file_path):
+    """
+    Reads reports from a file, one list of levels per line.
     """
     with open(file_path, 'r') as file:
-        reports = [list(map(int, line.split())) for line in file]
-    return sum(is_safe_report_with_dampener(report) for report in reports)
+        return [list(map(int, line.split())) for line in file]
+
+
+def parse_reports_matrix(file_path):
+    """
+    Reads all reports into a zero-padded integer matrix (one row per report)
+    and an array with the number of levels of each report.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the --numpy mode")
+
+    with open(file_path, 'r') as file:
+        text = file.read()
+
+    lengths = np.array([len(line.split()) for line in text.splitlines()], dtype=np.int64)
+    values = np.fromstring(text, dtype=np.int64, sep=' ')
+    if len(values) != lengths.sum():
+        raise ValueError("Reports must contain whitespace-separated integers only")
+
+    # Scatter the flat values into their rows; shorter rows keep the zero padding
+    levels = np.zeros((len(lengths), lengths.max(initial=0)), dtype=np.int64)
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    columns = np.arange(len(values)) - np.repeat(starts, lengths)
+    levels[rows, columns] = values
+    return levels, lengths
+
+
+def safe_rows(levels, lengths):
+    """
+    Vectorized is_safe_report for every row of a padded level matrix.
+    Steps past the end of a report are masked out and count as valid.
+    """
+    differences = np.diff(levels, axis=1)
+    padding = np.arange(differences.shape[1]) >= (lengths - 1)[:, None]
+
+    increasing = ((differences >= MIN_DIFF) & (differences <= MAX_DIFF)) | padding
+    decreasing = ((differences >= -MAX_DIFF) & (differences <= -MIN_DIFF)) | padding
+    return increasing.all(axis=1) | decreasing.all(axis=1)
+
+
+def safe_rows_with_dampener(levels, lengths):
+    """
+    Vectorized is_safe_report_with_dampener for every row of a padded level matrix.
+    Each level column is removed once for all rows at the same time; a removal
+    only counts for rows that actually have a level in that column.
+    """
+    safe = safe_rows(levels, lengths)
+    for column in range(levels.shape[1]):
+        has_level = column < lengths
+        safe |= has_level & safe_rows(np.delete(levels, column, axis=1), lengths - 1)
+    return safe
+
+
+def count_safe_reports_with_dampener(file_path, use_numpy=False):
+    """
+    Reads reports from a file and counts how many are safe considering the Problem Dampener.
+    With use_numpy, all reports are evaluated at once as a NumPy matrix.
+    """
+    if use_numpy:
+        return int(safe_rows_with_dampener(*parse_reports_matrix(file_path)).sum())
+    reports = parse_reports(file_path)
+    return sum(check_reports_with_dampener(reports))
 
 
 def main():
     import sys
 
     # Ensure the user provides a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python count_safe_reports_with_dampener.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != '--numpy'):
+        print("Usage: python count_safe_reports_with_dampener.py <input_file> [--numpy]")
         sys.exit(1)
 
     file_path = sys.argv[1]
+    use_numpy = len(sys.argv) == 3
 
     try:
         # Count safe reports considering the Problem Dampener
-        safe_count = count_safe_reports_with_dampener(file_path)
+        safe_count = count_safe_reports_with_dampener(file_path, use_numpy)
         print(f"The number of safe reports (with Problem Dampener) is: {safe_count}")
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
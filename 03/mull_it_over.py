@@ -1,3 +1,5 @@
+import mmap
+import os
 import re
 
 def extract_and_sum_mul_instructions(memory):
@@ -16,23 +18,76 @@ def extract_and_sum_mul_instructions(memory):
     
     return total_sum
 
+CHUNK_SIZE = 1 << 20  # Bytes read per step when streaming
+
+MUL_BYTES_PATTERN = re.compile(rb"mul\(\s*(\d+)\s*,\s*(\d+)\s*\)")
+# Matches the beginning of a `mul(X,Y)` instruction that reaches the end of the buffer
+PARTIAL_MUL_PATTERN = re.compile(rb"m(?:u(?:l(?:\(\s*(?:\d+\s*(?:,\s*(?:\d+\s*)?)?)?)?)?)?\Z")
+
+def scan_mul_instructions(stream, chunk_size=CHUNK_SIZE):
+    """
+    Scans a binary stream (an open file, a pipe or an mmap) chunk by chunk
+    for valid `mul(X,Y)` instructions and yields the running sum after each chunk.
+    An instruction cut off at the end of a chunk is carried over to the next one.
+    """
+    total_sum = 0
+    carry = b''
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        buffer = carry + chunk
+        end = 0
+        for match in MUL_BYTES_PATTERN.finditer(buffer):
+            total_sum += int(match[1]) * int(match[2])
+            end = match.end()
+
+        # Keep the unfinished instruction at the end of the buffer, if any
+        partial = PARTIAL_MUL_PATTERN.search(buffer, end)
+        carry = buffer[partial.start():] if partial else b''
+
+        yield total_sum
+
+def sum_from_stream(stream, chunk_size=CHUNK_SIZE):
+    """
+    Consumes a binary stream completely and returns the final sum.
+    """
+    total_sum = 0
+    for total_sum in scan_mul_instructions(stream, chunk_size):
+        pass
+    return total_sum
+
+def sum_from_file(file_path, chunk_size=CHUNK_SIZE):
+    """
+    Memory-maps the file and scans it chunk by chunk, so only one chunk
+    at a time has to be held in memory.
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return 0  # Empty files cannot be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            return sum_from_stream(memory, chunk_size)
+
 def main():
     import sys
 
     # Ensure the user provides a file path as an argument
     if len(sys.argv) != 2:
-        print("Usage: python mull_it_over.py <input_file>")
+        print("Usage: python mull_it_over.py <input_file|->")
         sys.exit(1)
 
     file_path = sys.argv[1]
 
     try:
-        # Read the corrupted memory input from the file
-        with open(file_path, 'r') as file:
-            memory = file.read()
+        # Stream the corrupted memory from the file (or stdin) in chunks
+        if file_path == '-':
+            result = sum_from_stream(sys.stdin.buffer)
+        else:
+            result = sum_from_file(file_path)
 
-        # Extract and sum valid `mul` instructions
-        result = extract_and_sum_mul_instructions(memory)
+        # Report the sum of valid `mul` instructions
         print(f"The sum of all valid `mul` instructions is: {result}")
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
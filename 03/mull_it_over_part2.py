@@ -1,57 +1,207 @@
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+
+# A single pattern for all three instructions, so one left-to-right scan sees
+# them in order: `mul(X,Y)` fills groups 1 and 2, `do()` and `don't()` group 3
+INSTRUCTION_PATTERN = re.compile(r"mul\(\s*(\d+)\s*,\s*(\d+)\s*\)|(do\(\)|don't\(\))")
 
 def extract_and_sum_mul_with_conditions(memory):
     """
     Scans the memory string for valid `mul(X,Y)` instructions
     and sums up their results, taking into account `do()` and `don't()` conditions.
     """
-    # Regular expressions for parsing
-    mul_pattern = r"mul\(\s*(\d+)\s*,\s*(\d+)\s*\)"
-    condition_pattern = r"(do\(\)|don't\(\))"
-
     # Track enabled/disabled state for `mul` instructions
     enabled = True
     total_sum = 0
 
-    # Iterate through the memory looking for conditions and valid `mul` instructions
-    position = 0
-    while position < len(memory):
-        # Search for the next condition or `mul` instruction
-        condition_match = re.search(condition_pattern, memory[position:])
-        mul_match = re.search(mul_pattern, memory[position:])
-
-        # Determine the next relevant instruction
-        if condition_match and (not mul_match or condition_match.start() < mul_match.start()):
-            condition = condition_match.group()
+    # Visit the conditions and valid `mul` instructions in the order they appear
+    for match in INSTRUCTION_PATTERN.finditer(memory):
+        x, y, condition = match.groups()
+        if condition:
             enabled = condition == "do()"
-            position += condition_match.end()
-        elif mul_match:
-            if enabled:
-                x, y = map(int, mul_match.groups())
-                total_sum += x * y
-            position += mul_match.end()
-        else:
+        elif enabled:
+            total_sum += int(x) * int(y)
+
+    return total_sum
+
+CHUNK_SIZE = 1 << 20  # Bytes read per step when streaming
+
+INSTRUCTION_BYTES_PATTERN = re.compile(INSTRUCTION_PATTERN.pattern.encode())
+# Matches the beginning of an instruction that reaches the end of the buffer
+PARTIAL_INSTRUCTION_PATTERN = re.compile(
+    rb"(?:m(?:u(?:l(?:\(\s*(?:\d+\s*(?:,\s*(?:\d+\s*)?)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?)\Z"
+)
+
+def scan_mul_with_conditions(stream, chunk_size=CHUNK_SIZE):
+    """
+    Scans a binary stream (an open file, a pipe or an mmap) chunk by chunk
+    for valid `mul(X,Y)` instructions, taking into account `do()` and `don't()`
+    conditions, and yields the running sum after each chunk.
+    An instruction cut off at the end of a chunk is carried over to the next
+    one, and the enabled state carries over as well.
+    """
+    enabled = True
+    total_sum = 0
+    carry = b''
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
             break
 
+        buffer = carry + chunk
+        end = 0
+        for match in INSTRUCTION_BYTES_PATTERN.finditer(buffer):
+            x, y, condition = match.groups()
+            if condition:
+                enabled = condition == b"do()"
+            elif enabled:
+                total_sum += int(x) * int(y)
+            end = match.end()
+
+        # Keep the unfinished instruction at the end of the buffer, if any
+        partial = PARTIAL_INSTRUCTION_PATTERN.search(buffer, end)
+        carry = buffer[partial.start():] if partial else b''
+
+        yield total_sum
+
+def sum_from_stream(stream, chunk_size=CHUNK_SIZE):
+    """
+    Consumes a binary stream completely and returns the final sum.
+    """
+    total_sum = 0
+    for total_sum in scan_mul_with_conditions(stream, chunk_size):
+        pass
+    return total_sum
+
+def sum_from_file(file_path, chunk_size=CHUNK_SIZE):
+    """
+    Memory-maps the file and scans it chunk by chunk, so only one chunk
+    at a time has to be held in memory.
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return 0  # Empty files cannot be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            return sum_from_stream(memory, chunk_size)
+
+def find_shard_bounds(memory, shards):
+    """
+    Splits the memory (a string, bytes or an mmap) into at most `shards`
+    consecutive (start, end) ranges. Every boundary is moved forward onto an
+    'm' or a 'd': those letters only occur at the start of an instruction, so
+    no instruction spans a boundary and each shard can be scanned on its own.
+    """
+    letters = ('m', 'd') if isinstance(memory, str) else (b'm', b'd')
+    bounds = []
+    start = 0
+    for shard in range(1, shards + 1):
+        end = len(memory) * shard // shards
+        if shard < shards and end > start:
+            found = [position for position in (memory.find(letter, end) for letter in letters) if position >= 0]
+            end = min(found, default=len(memory))
+        if end > start:
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+def evaluate_shard(matches):
+    """
+    Evaluates the instruction matches of one shard without knowing whether
+    `mul` instructions are enabled at its start.
+
+    Returns (enabled_sum, disabled_sum, final_state): the shard's sum if it
+    starts enabled and if it starts disabled, and the state after its last
+    condition (None if it contains no condition and keeps the incoming state).
+    """
+    leading_sum = 0  # Sum before the first condition; only counts if enabled at the start
+    trailing_sum = 0
+    state = None
+
+    for match in matches:
+        x, y, condition = match.groups()
+        if condition:
+            state = condition in ("do()", b"do()")
+        elif state is None:
+            leading_sum += int(x) * int(y)
+        elif state:
+            trailing_sum += int(x) * int(y)
+
+    return leading_sum + trailing_sum, trailing_sum, state
+
+def combine_shards(results):
+    """
+    Combines the shard results in order, passing the enabled state from
+    each shard to the next one.
+    """
+    enabled = True
+    total_sum = 0
+    for enabled_sum, disabled_sum, state in results:
+        total_sum += enabled_sum if enabled else disabled_sum
+        if state is not None:
+            enabled = state
     return total_sum
 
+def evaluate_text_shard(memory):
+    return evaluate_shard(INSTRUCTION_PATTERN.finditer(memory))
+
+def evaluate_file_shard(file_path, start, end):
+    # Each worker maps the file itself, so no shard data is copied between processes
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            return evaluate_shard(INSTRUCTION_BYTES_PATTERN.finditer(memory, start, end))
+
+def extract_and_sum_mul_with_conditions_parallel(memory, workers=None):
+    """
+    Multi-process variant of extract_and_sum_mul_with_conditions: the memory
+    is split into one shard per worker, the shards are evaluated in parallel
+    and their results are combined in order.
+    """
+    workers = workers or os.cpu_count()
+    shards = [memory[start:end] for start, end in find_shard_bounds(memory, workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return combine_shards(executor.map(evaluate_text_shard, shards))
+
+def sum_from_file_parallel(file_path, workers=None):
+    """
+    Multi-process variant of sum_from_file; every worker scans its shard of
+    the memory-mapped file.
+    """
+    workers = workers or os.cpu_count()
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return 0  # Empty files cannot be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            bounds = find_shard_bounds(memory, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(evaluate_file_shard, [file_path] * len(bounds), *zip(*bounds))
+        return combine_shards(results)
+
 def main():
     import sys
 
     # Ensure the user provides a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python mull_it_over_part2.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != '--parallel'):
+        print("Usage: python mull_it_over_part2.py <input_file|-> [--parallel]")
         sys.exit(1)
 
     file_path = sys.argv[1]
+    parallel = len(sys.argv) == 3
 
     try:
-        # Read the corrupted memory input from the file
-        with open(file_path, 'r') as file:
-            memory = file.read()
+        # Stream the corrupted memory from the file (or stdin) in chunks
+        if file_path == '-':
+            result = sum_from_stream(sys.stdin.buffer)
+        elif parallel:
+            # Scan shards of the file in one process per CPU
+            result = sum_from_file_parallel(file_path)
+        else:
+            result = sum_from_file(file_path)
 
-        # Extract and sum valid `mul` instructions with conditions
-        result = extract_and_sum_mul_with_conditions(memory)
+        # Report the sum of enabled `mul` instructions
         print(f"The sum of all enabled `mul` instructions is: {result}")
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
@@ -1,47 +1,215 @@
+import os
 import sys
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.grid import Grid, OUTSIDE
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only needed for --numpy
+    np = None
 
 def count_xmas_occurrences(grid):
     """
     Counts all occurrences of the word "XMAS" in the word search grid.
     Words can be horizontal, vertical, diagonal, backwards, and overlapping.
     """
-    def is_valid(x, y):
-        return 0 <= x < rows and 0 <= y < cols
-
-    def check_direction(x, y, dx, dy):
+    def check_direction(index, step):
+        # Stops at the first mismatch, so it never walks past the grid's padding
         for i in range(len(word)):
-            if not is_valid(x + i * dx, y + i * dy) or grid[x + i * dx][y + i * dy] != word[i]:
+            if cells[index + i * step] != word[i]:
                 return False
         return True
 
-    word = "XMAS"
-    rows, cols = len(grid), len(grid[0])
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]  # 8 directions
+    word = b"XMAS"
+    cells = grid.cells
+    directions = grid.directions + grid.diagonals  # 8 directions
     count = 0
 
-    for x in range(rows):
-        for y in range(cols):
-            for dx, dy in directions:
-                if check_direction(x, y, dx, dy):
-                    count += 1
+    for index in grid.indices():
+        if cells[index] != word[0]:
+            continue
+        for step in directions:
+            if check_direction(index, step):
+                count += 1
     return count
 
 
+def as_array(grid):
+    """
+    Returns the grid's cells as a NumPy uint8 array sharing its memory.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the --numpy mode")
+    return np.frombuffer(grid.cells, dtype=np.uint8)
+
+
+def count_word_matches(letter_masks, word, step):
+    """
+    Counts the cell indices where `word` starts and continues in steps of `step`.
+    Instead of walking from every cell, the precomputed mask of each letter is
+    shifted by its position in the word and the masks are ANDed for all cells
+    at once. A word leaving the grid always crosses the padding, which matches
+    no letter, so only the array bounds have to be respected.
+    """
+    size = len(letter_masks[word[0]])
+    span = (len(word) - 1) * step
+    start, end = max(0, -span), min(size, size - span)
+    if start >= end:
+        return 0  # The word is longer than the whole array
+    matches = letter_masks[word[0]][start:end].copy()
+    for i in range(1, len(word)):
+        matches &= letter_masks[word[i]][start + i * step:end + i * step]
+    return int(np.count_nonzero(matches))
+
+
+def count_xmas_occurrences_numpy(grid):
+    """
+    Vectorized variant of count_xmas_occurrences.
+    """
+    word = b"XMAS"
+    cells = as_array(grid)
+    letter_masks = {letter: cells == letter for letter in set(word)}
+    return sum(count_word_matches(letter_masks, word, step) for step in grid.directions + grid.diagonals)
+
+
+def grid_lines(grid):
+    """
+    Yields every row, column and diagonal of the grid once, as the list of
+    its cell indices together with the index step between them
+    (right, down, down-right and down-left).
+    """
+    cells = grid.cells
+    _, right, down, _ = grid.directions
+    for step in (right, down, down + right, down - right):
+        for index in grid.indices():
+            # A line starts where the previous cell in its direction is padding
+            if cells[index - step] != OUTSIDE:
+                continue
+            line = []
+            while cells[index] != OUTSIDE:
+                line.append(index)
+                index += step
+            yield line, step
+
+
+def build_automaton(words):
+    """
+    Builds an Aho–Corasick automaton for the words and their reversals, so a
+    single forward scan of a line finds the words in both directions.
+
+    Returns (transitions, failures, outputs): the trie's transitions per
+    state (byte -> state), the failure link of each state, and per state the
+    (word, backward) pairs ending there, including those of its suffixes.
+    Duplicate and empty words are ignored.
+    """
+    words = [word for word in dict.fromkeys(words) if word]
+    transitions = [{}]
+    outputs = [[]]
+    for word in words:
+        for pattern, backward in ((word.encode(), False), (word[::-1].encode(), True)):
+            state = 0
+            for char in pattern:
+                if char not in transitions[state]:
+                    transitions[state][char] = len(transitions)
+                    transitions.append({})
+                    outputs.append([])
+                state = transitions[state][char]
+            outputs[state].append((word, backward))
+
+    # Breadth-first, so every failure target is complete before it is used
+    failures = [0] * len(transitions)
+    queue = deque(transitions[0].values())
+    while queue:
+        state = queue.popleft()
+        for char, next_state in transitions[state].items():
+            failure = failures[state]
+            while failure and char not in transitions[failure]:
+                failure = failures[failure]
+            failures[next_state] = transitions[failure].get(char, 0)
+            outputs[next_state] = outputs[next_state] + outputs[failures[next_state]]
+            queue.append(next_state)
+
+    return transitions, failures, outputs
+
+
+def search_words(grid, words):
+    """
+    Finds all occurrences of the words in the grid in all 8 directions with
+    one pass over every row, column and diagonal.
+
+    Returns a dictionary mapping each word to a list of (row, col, d_row, d_col)
+    tuples: the position of its first letter and the direction it reads in.
+    Duplicate words are searched once, and empty words are ignored.
+    """
+    words = [word for word in dict.fromkeys(words) if word]
+    transitions, failures, outputs = build_automaton(words)
+    found = {word: [] for word in words}
+    cells = grid.cells
+
+    for line, step in grid_lines(grid):
+        start_row, start_col = grid.position(line[0])
+        next_row, next_col = grid.position(line[0] + step)
+        direction = (next_row - start_row, next_col - start_col)
+        backward_direction = (-direction[0], -direction[1])
+
+        state = 0
+        for position, index in enumerate(line):
+            char = cells[index]
+            while state and char not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(char, 0)
+
+            for word, backward in outputs[state]:
+                if backward:
+                    # The reversed word ends here, so the word itself starts here
+                    found[word].append((*grid.position(index), *backward_direction))
+                else:
+                    first = line[position - len(word) + 1]
+                    found[word].append((*grid.position(first), *direction))
+
+    return found
+
+
+def count_words(grid, words):
+    """
+    Counts the occurrences of each word in the grid in all 8 directions.
+    """
+    return {word: len(positions) for word, positions in search_words(grid, words).items()}
+
+
+def read_words(file_path):
+    """
+    Reads the words to search for, one per line.
+    """
+    with open(file_path, 'r') as file:
+        return list(dict.fromkeys(line.strip() for line in file if line.strip()))
+
+
 def main():
     # Ensure the user provides a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python ceres_search.py <input_file>")
+    if not (len(sys.argv) == 2 or (len(sys.argv) == 3 and sys.argv[2] == '--numpy')
+            or (len(sys.argv) == 4 and sys.argv[2] == '--words')):
+        print("Usage: python ceres_search.py <input_file> [--numpy | --words <words_file>]")
         sys.exit(1)
 
     file_path = sys.argv[1]
+    use_numpy = len(sys.argv) == 3
 
     try:
         # Read the word search grid from the file
-        with open(file_path, 'r') as file:
-            grid = [list(line.strip()) for line in file if line.strip()]
+        grid = Grid.from_file(file_path)
+
+        if len(sys.argv) == 4:
+            # Count the occurrences of every word of the list in one pass
+            for word, count in count_words(grid, read_words(sys.argv[3])).items():
+                print(f"{word}: {count}")
+            return
 
         # Count all occurrences of "XMAS"
-        result = count_xmas_occurrences(grid)
+        result = count_xmas_occurrences_numpy(grid) if use_numpy else count_xmas_occurrences(grid)
         print(f"The word 'XMAS' appears {result} times in the word search.")
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
@@ -1,98 +1,122 @@
+import os
 import sys
 
-# Global grid and dimensions
-grid = []
-rows, cols = 0, 0
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
+from aoc.grid import Grid
 
-def is_valid_position(x, y):
-    """
-    Check if the given position (x, y) is within the grid bounds.
-    """
-    return 0 <= x < rows and 0 <= y < cols
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only needed for --numpy
+    np = None
+
+M, A, S = b"MAS"
 
 
-def check_diagonal(x, y, primary_diagonal, secondary_diagonal):
+def check_diagonal(cells, index, primary_diagonal, secondary_diagonal):
     """
     Check a single diagonal for an X-MAS pattern.
 
     Parameters:
-    - x, y: Center position (must be 'A').
-    - primary_diagonal: Tuple for the first arm's direction (x_offset, y_offset).
-    - secondary_diagonal: Tuple for the second arm's direction (x_offset, y_offset).
+    - cells: The grid's cells.
+    - index: Center cell index (must be 'A').
+    - primary_diagonal: Index offset of the first arm.
+    - secondary_diagonal: Index offset of the second arm.
 
     Returns:
     - 1 if the diagonal forms a valid X-MAS leg, 0 otherwise.
     """
-    x1, y1 = x + primary_diagonal[0], y + primary_diagonal[1]  # First diagonal arm
-    x2, y2 = x + secondary_diagonal[0], y + secondary_diagonal[1]  # Second diagonal arm
+    first = cells[index + primary_diagonal]  # First diagonal arm
+    second = cells[index + secondary_diagonal]  # Second diagonal arm
 
-    # Check if both positions are valid
-    if not (is_valid_position(x1, y1) and is_valid_position(x2, y2)):
-        return 0
-
-    # Check for 'M ↔ S' or 'S ↔ M' pattern
-    if (grid[x1][y1] == 'M' and grid[x2][y2] == 'S') or (grid[x1][y1] == 'S' and grid[x2][y2] == 'M'):
+    # Check for 'M ↔ S' or 'S ↔ M' pattern; the padding matches neither
+    if (first == M and second == S) or (first == S and second == M):
         return 1
 
     return 0
 
 
-def count_x_mas_at(x, y):
+def count_x_mas_at(grid, index):
     """
-    Check for an X-MAS pattern centered at grid[x][y].
+    Check for an X-MAS pattern centered at the given cell.
 
     An X-MAS pattern requires:
     - The center to be 'A'.
     - Two valid diagonal legs (top-left ↔ bottom-right, top-right ↔ bottom-left).
     """
-    if grid[x][y] != "A":
+    cells = grid.cells
+    if cells[index] != A:
         return 0  # Center must be 'A'
 
     # Define diagonal directions
+    top_left, top_right, bottom_left, bottom_right = grid.diagonals
     diagonals = [
-        ((-1, -1), (1, 1)),  # Top-left ↔ Bottom-right
-        ((-1, 1), (1, -1))   # Top-right ↔ Bottom-left
+        (top_left, bottom_right),  # Top-left ↔ Bottom-right
+        (top_right, bottom_left)   # Top-right ↔ Bottom-left
     ]
 
     # Count the number of valid diagonal legs
-    valid_legs = sum(check_diagonal(x, y, primary_diagonal, secondary_diagonal) for primary_diagonal, secondary_diagonal in diagonals)
+    valid_legs = sum(check_diagonal(cells, index, primary_diagonal, secondary_diagonal) for primary_diagonal, secondary_diagonal in diagonals)
 
     # If both diagonal legs are valid, it's an X-MAS pattern
     return 1 if valid_legs == 2 else 0
 
 
-def count_total_x_mas():
+def count_total_x_mas(grid):
     """
     Count all X-MAS patterns in the grid by checking every cell as a potential center.
     """
     total_count = 0
-    for x in range(rows):
-        for y in range(cols):
-            total_count += count_x_mas_at(x, y)
+    for index in grid.indices():
+        total_count += count_x_mas_at(grid, index)
     return total_count
 
 
-def main():
-    global grid, rows, cols
+def as_array(grid):
+    """
+    Returns the grid's cells as a NumPy uint8 array sharing its memory.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the --numpy mode")
+    return np.frombuffer(grid.cells, dtype=np.uint8)
 
+
+def count_total_x_mas_numpy(grid):
+    """
+    Vectorized variant of count_total_x_mas: every cell is tested as a center
+    at once by comparing shifted views of the cell array.
+    """
+    cells = as_array(grid)
+    top_left, top_right, bottom_left, bottom_right = grid.diagonals
+
+    # Centers never lie in the padding, so the diagonal neighbors stay inside the array
+    start, end = -top_left, len(cells) - bottom_right
+
+    def arm(offset):
+        return cells[start + offset:end + offset]
+
+    def leg(first, second):
+        # 'M ↔ S' or 'S ↔ M' along one diagonal
+        return ((arm(first) == M) & (arm(second) == S)) | ((arm(first) == S) & (arm(second) == M))
+
+    centers = cells[start:end] == A
+    return int(np.count_nonzero(centers & leg(top_left, bottom_right) & leg(top_right, bottom_left)))
+
+def main():
     # Ensure the user provides a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python ceres_search_part2.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != '--numpy'):
+        print("Usage: python ceres_search_part2.py <input_file> [--numpy]")
         sys.exit(1)
 
     file_path = sys.argv[1]
+    use_numpy = len(sys.argv) == 3
 
     try:
         # Read the word search grid from the file
-        with open(file_path, 'r') as file:
-            grid = [list(line.strip()) for line in file if line.strip()]
-
-        # Update global dimensions
-        rows, cols = len(grid), len(grid[0])
+        grid = Grid.from_file(file_path)
 
         # Count all occurrences of X-MAS
-        result = count_total_x_mas()
+        result = count_total_x_mas_numpy(grid) if use_numpy else count_total_x_mas(grid)
         print(f"The X-MAS pattern appears {result} times in the word search.")
     except FileNotFoundError:
         print(f"Error: The file '{file_path}' does not exist.")
@@ -29,22 +29,37 @@ def parse_input(file_path):
     return rules, updates
 
 
-def is_update_ordered(update, rules):
+def build_rule_index(rules):
+    """
+    Compile the ordering rules into a set of (before, after) page pairs,
+    so checking whether two pages are ordered is a single hash lookup.
+
+    Parameters:
+    - rules: List of tuples representing ordering rules.
+
+    Returns:
+    - A set of (before, after) tuples.
+    """
+    return set(rules)
+
+
+def is_update_ordered(update, rule_index):
     """
     Check if an update is in the correct order according to the rules.
+    Only the pairs of pages within the update are looked up, so the cost
+    depends on the update length, not on the number of rules.
 
     Parameters:
     - update: List of integers representing the pages in the update.
-    - rules: List of tuples representing ordering rules.
+    - rule_index: Set of (before, after) tuples from build_rule_index.
 
     Returns:
     - True if the update is ordered correctly, False otherwise.
     """
-    page_positions = {page: pos for pos, page in enumerate(update)}
-    
-    for before, after in rules:
-        if before in page_positions and after in page_positions:
-            if page_positions[before] > page_positions[after]:
+    for i, earlier in enumerate(update):
+        for later in update[i + 1:]:
+            # A rule requiring the later page first is violated
+            if (later, earlier) in rule_index:
                 return False
     return True
 
@@ -75,10 +90,11 @@ def main():
     try:
         # Parse input file
         rules, updates = parse_input(file_path)
+        rule_index = build_rule_index(rules)
 
         # Process updates
         correctly_ordered_updates = [
-            update for update in updates if is_update_ordered(update, rules)
+            update for update in updates if is_update_ordered(update, rule_index)
         ]
 
         # Find middle page numbers and compute their sum
@@ -1,4 +1,5 @@
 from collections import defaultdict, deque
+from functools import cmp_to_key
 
 def parse_input(file_path):
     """
@@ -31,33 +32,48 @@ def parse_input(file_path):
     return rules, updates
 
 
-def is_update_ordered(update, rules):
+def build_rule_index(rules):
+    """
+    Compile the ordering rules into a set of (before, after) page pairs,
+    so checking whether two pages are ordered is a single hash lookup.
+
+    Parameters:
+    - rules: List of tuples representing ordering rules.
+
+    Returns:
+    - A set of (before, after) tuples.
+    """
+    return set(rules)
+
+
+def is_update_ordered(update, rule_index):
     """
     Check if an update is in the correct order according to the rules.
+    Only the pairs of pages within the update are looked up, so the cost
+    depends on the update length, not on the number of rules.
 
     Parameters:
     - update: List of integers representing the pages in the update.
-    - rules: List of tuples representing ordering rules.
+    - rule_index: Set of (before, after) tuples from build_rule_index.
 
     Returns:
     - True if the update is ordered correctly, False otherwise.
     """
-    page_positions = {page: pos for pos, page in enumerate(update)}
-    
-    for before, after in rules:
-        if before in page_positions and after in page_positions:
-            if page_positions[before] > page_positions[after]:
+    for i, earlier in enumerate(update):
+        for later in update[i + 1:]:
+            # A rule requiring the later page first is violated
+            if (later, earlier) in rule_index:
                 return False
     return True
 
 
-def reorder_update(update, rules):
+def reorder_update(update, rule_index):
     """
     Reorder an update to follow the given rules.
 
     Parameters:
     - update: List of integers representing the pages in the update.
-    - rules: List of tuples representing ordering rules.
+    - rule_index: Set of (before, after) tuples from build_rule_index.
 
     Returns:
     - List of integers representing the reordered update.
@@ -66,9 +82,9 @@ def reorder_update(update, rules):
     graph = defaultdict(list)
     in_degree = defaultdict(int)
     
-    # Filter rules to only include relevant pages in this update
-    relevant_rules = [(before, after) for before, after in rules if before in update and after in update]
+    # Look up the rules between pages of this update
     pages = set(update)
+    relevant_rules = [(before, after) for before in pages for after in pages if (before, after) in rule_index]
     
     for before, after in relevant_rules:
         graph[before].append(after)
@@ -91,6 +107,60 @@ def reorder_update(update, rules):
     return sorted_pages
 
 
+def compare_pages(first, second, rule_index):
+    """
+    Compare two pages by the ordering rules.
+
+    Returns:
+    - -1 if a rule puts `first` before `second`, 1 if the other way round, 0 otherwise.
+    """
+    if (first, second) in rule_index:
+        return -1
+    if (second, first) in rule_index:
+        return 1
+    return 0
+
+
+def reorder_update_sorted(update, rule_index):
+    """
+    Reorder an update by sorting it with the ordering rules as comparator,
+    instead of building a graph and running a topological sort.
+
+    Parameters:
+    - update: List of integers representing the pages in the update.
+    - rule_index: Set of (before, after) tuples from build_rule_index.
+
+    Returns:
+    - List of integers representing the reordered update.
+    """
+    return sorted(update, key=cmp_to_key(lambda first, second: compare_pages(first, second, rule_index)))
+
+
+def find_reordered_middle_page(update, rule_index):
+    """
+    Find the middle page of the reordered update without reordering it.
+    When the rules order every pair of pages in the update, the page in
+    the middle is the one that exactly half of the other pages must precede.
+    If the rules leave pages unordered, this falls back to sorting.
+
+    Parameters:
+    - update: List of integers representing the pages in the update.
+    - rule_index: Set of (before, after) tuples from build_rule_index.
+
+    Returns:
+    - The middle page number of the reordered update.
+    """
+    middle = len(update) // 2
+    for page in update:
+        preceding = sum((other, page) in rule_index for other in update)
+        if preceding == middle:
+            following = sum((page, other) in rule_index for other in update)
+            if preceding + following == len(update) - 1:
+                return page
+
+    return find_middle_page(reorder_update_sorted(update, rule_index))
+
+
 def find_middle_page(update):
     """
     Find the middle page number of an update.
@@ -108,26 +178,35 @@ def main():
     import sys
 
     # Ensure the user provides a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python print_queue_part2.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] not in ('--sort', '--middle')):
+        print("Usage: python print_queue_part2.py <input_file> [--sort | --middle]")
         sys.exit(1)
 
     file_path = sys.argv[1]
+    engine = sys.argv[2] if len(sys.argv) == 3 else None
 
     try:
         # Parse input file
         rules, updates = parse_input(file_path)
+        rule_index = build_rule_index(rules)
 
         # Process updates
         incorrectly_ordered_updates = [
-            update for update in updates if not is_update_ordered(update, rules)
+            update for update in updates if not is_update_ordered(update, rule_index)
         ]
 
-        # Reorder the incorrect updates
-        reordered_updates = [reorder_update(update, rules) for update in incorrectly_ordered_updates]
+        if engine == '--middle':
+            # Select the middle pages directly, without reordering
+            middle_pages = [find_reordered_middle_page(update, rule_index) for update in incorrectly_ordered_updates]
+        else:
+            # Reorder the incorrect updates
+            reorder = reorder_update_sorted if engine == '--sort' else reorder_update
+            reordered_updates = [reorder(update, rule_index) for update in incorrectly_ordered_updates]
+
+            # Find middle page numbers
+            middle_pages = [find_middle_page(update) for update in reordered_updates]
 
-        # Find middle page numbers and compute their sum
-        middle_pages = [find_middle_page(update) for update in reordered_updates]
+        # Compute the sum of the middle page numbers
         result = sum(middle_pages)
 
         print(f"The sum of the middle page numbers from correctly-reordered updates is: {result}")
@@ -1,22 +1,28 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.grid import Grid, OUTSIDE
+
+OBSTACLE = ord('#')
+
+
 def parse_map(file_path):
     """
     Parse the input file to create the map grid and find the guard's initial position and direction.
+    Positions are cell indices of the grid; directions index `grid.directions` (0 = up, clockwise).
     """
-    with open(file_path, 'r') as file:
-        grid = [list(line.strip()) for line in file if line.strip()]
+    grid = Grid.from_file(file_path)
 
     # Locate the guard's starting position and direction
-    directions = {'^': (-1, 0), 'v': (1, 0), '<': (0, -1), '>': (0, 1)}
-    guard_position = None
-    guard_direction = None
-
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] in directions:
-                guard_position = (row, col)
-                guard_direction = directions[grid[row][col]]
-                grid[row][col] = '.'  # Clear the guard's initial position for the simulation
-                return grid, guard_position, guard_direction
+    directions = {'^': 0, '>': 1, 'v': 2, '<': 3}
+
+    for char, direction in directions.items():
+        guard_position = grid.find(char)
+        if guard_position is not None:
+            grid[guard_position] = '.'  # Clear the guard's initial position for the simulation
+            return grid, guard_position, direction
 
     raise ValueError("No guard (caret) found in the map!")
 
@@ -25,12 +31,7 @@ def turn_right(direction):
     """
     Turn the guard 90 degrees to the right.
     """
-    return {
-        (-1, 0): (0, 1),   # Up -> Right
-        (0, 1): (1, 0),    # Right -> Down
-        (1, 0): (0, -1),   # Down -> Left
-        (0, -1): (-1, 0)   # Left -> Up
-    }[direction]
+    return (direction + 1) % 4  # Up -> Right -> Down -> Left -> Up
 
 
 def simulate_patrol(grid, start_position, start_direction):
@@ -38,32 +39,42 @@ def simulate_patrol(grid, start_position, start_direction):
     Simulate the guard's patrol and mark visited positions with 'X'.
 
     Parameters:
-    - grid: The lab map as a list of lists.
-    - start_position: The initial position of the guard as (row, col).
-    - start_direction: The initial direction of the guard as (row_offset, col_offset).
+    - grid: The lab map as a Grid.
+    - start_position: The cell index of the guard's initial position.
+    - start_direction: The initial direction of the guard as an index into grid.directions.
 
     Returns:
     - The modified grid with visited positions marked as 'X'.
+
+    Raises:
+    - ValueError if the guard patrols in a loop instead of leaving the map.
     """
+    cells = grid.cells
+    steps = grid.directions
+    visited = ord('X')
+    # Turn states encoded as `cell_index * 4 + direction`, to detect a patrol that never ends
+    turn_states = bytearray(len(cells) * 4)
     current_position = start_position
     current_direction = start_direction
-    rows, cols = len(grid), len(grid[0])
 
     while True:
         # Mark the current position as visited
-        x, y = current_position
-        grid[x][y] = 'X'
+        cells[current_position] = visited
 
         # Determine the next position
-        next_position = (x + current_direction[0], y + current_direction[1])
+        next_position = current_position + steps[current_direction]
 
         # Check if the next position is out of bounds
-        if not (0 <= next_position[0] < rows and 0 <= next_position[1] < cols):
+        if cells[next_position] == OUTSIDE:
             # Guard leaves the map
             break
 
         # Check if the next position is obstructed
-        if grid[next_position[0]][next_position[1]] == '#':
+        if cells[next_position] == OBSTACLE:
+            state = current_position * 4 + current_direction
+            if turn_states[state]:
+                raise ValueError("The guard patrols in a loop and never leaves the map")
+            turn_states[state] = 1
             # Turn right if there's an obstacle
             current_direction = turn_right(current_direction)
         else:
@@ -77,7 +88,7 @@ def count_visited(grid):
     """
     Count the number of positions marked as 'X' in the grid.
     """
-    return sum(row.count('X') for row in grid)
+    return grid.count('X')
 
 
 def main():
@@ -1,22 +1,31 @@
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.grid import Grid, OUTSIDE
+
+OBSTACLE = ord('#')
+
+
 def parse_map(file_path):
     """
     Parse the input file to create the map grid and find the guard's initial position and direction.
+    Positions are cell indices of the grid; directions index `grid.directions` (0 = up, clockwise).
     """
-    with open(file_path, 'r') as file:
-        grid = [list(line.strip()) for line in file if line.strip()]
+    grid = Grid.from_file(file_path)
 
     # Locate the guard's starting position and direction
-    directions = {'^': (-1, 0), 'v': (1, 0), '<': (0, -1), '>': (0, 1)}
-    guard_position = None
-    guard_direction = None
-
-    for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] in directions:
-                guard_position = (row, col)
-                guard_direction = directions[grid[row][col]]
-                grid[row][col] = '.'  # Clear the guard's initial position for the simulation
-                return grid, guard_position, guard_direction
+    directions = {'^': 0, '>': 1, 'v': 2, '<': 3}
+
+    for char, direction in directions.items():
+        guard_position = grid.find(char)
+        if guard_position is not None:
+            grid[guard_position] = '.'  # Clear the guard's initial position for the simulation
+            return grid, guard_position, direction
 
     raise ValueError("No guard (caret) found in the map!")
 
@@ -25,57 +34,153 @@ def turn_right(direction):
     """
     Turn the guard 90 degrees to the right.
     """
-    return {
-        (-1, 0): (0, 1),   # Up -> Right
-        (0, 1): (1, 0),    # Right -> Down
-        (1, 0): (0, -1),   # Down -> Left
-        (0, -1): (-1, 0)   # Left -> Up
-    }[direction]
+    return (direction + 1) % 4  # Up -> Right -> Down -> Left -> Up
+
+
+def build_jump_table(grid):
+    """
+    Precompute where the guard stops when walking straight from any cell.
+
+    Parameters:
+    - grid: The lab map as a Grid.
+
+    Returns:
+    - A list with one list per direction, mapping each free cell index to the
+      last cell the guard reaches before the next obstacle or the map's edge.
+    """
+    cells = grid.cells
+    jumps = []
+
+    for step in grid.directions:
+        jump = [0] * len(cells)
+        # Visit the cells against the walking direction, so the cell ahead is already done
+        indices = range(len(cells) - 1, -1, -1) if step > 0 else range(len(cells))
+        for index in indices:
+            if cells[index] in (OBSTACLE, OUTSIDE):
+                continue
+            ahead = index + step
+            jump[index] = index if cells[ahead] in (OBSTACLE, OUTSIDE) else jump[ahead]
+        jumps.append(jump)
+
+    return jumps
+
+
+class StateMarks:
+    """
+    Marks of visited guard states, encoded as `cell_index * 4 + direction`,
+    reused across simulations. Instead of clearing the marks before every
+    simulation, each one stamps its states with a new generation number; the
+    marks are only wiped when the generation counter wraps around.
+    """
+    def __init__(self, size):
+        self.marks = bytearray(size * 4)
+        self.generation = 0
+
+    def next_generation(self):
+        self.generation += 1
+        if self.generation > 255:
+            self.marks[:] = bytes(len(self.marks))
+            self.generation = 1
+        return self.generation
 
 
-def simulate_with_obstacle(grid, start_position, start_direction, obstacle):
+def simulate_with_obstacle(grid, start_position, start_direction, obstacle, jumps, states=None):
     """
     Simulate the guard's patrol with an added obstacle to check for loops.
+    The guard jumps from turn to turn using the precomputed jump table; the
+    added obstacle is not written into the grid but cuts a jump short when it
+    lies on the jump's row or column segment.
 
     Parameters:
-    - grid: The lab map as a list of lists.
-    - start_position: The initial position of the guard as (row, col).
-    - start_direction: The initial direction of the guard as (row_offset, col_offset).
-    - obstacle: The position (row, col) of the added obstacle.
+    - grid: The lab map as a Grid.
+    - start_position: The cell index of the guard's initial position.
+    - start_direction: The initial direction of the guard as an index into grid.directions.
+    - obstacle: The cell index of the added obstacle.
+    - jumps: The jump table of the grid from build_jump_table.
+    - states: StateMarks of the grid to reuse between simulations (optional).
 
     Returns:
     - True if the guard gets stuck in a loop, False otherwise.
     """
-    rows, cols = len(grid), len(grid[0])
+    cells = grid.cells
+    steps = grid.directions
     current_position = start_position
     current_direction = start_direction
-    visited_states = set()
-
-    # Add the obstacle to the grid temporarily
-    grid[obstacle[0]][obstacle[1]] = '#'
+    if states is None:
+        states = StateMarks(len(cells))
+    marks = states.marks
+    generation = states.next_generation()
 
     while True:
-        # Save the current state (position and direction) to detect loops
-        state = (current_position, current_direction)
-        if state in visited_states:
+        step = steps[current_direction]
+        stop = jumps[current_direction][current_position]
+
+        # Does the added obstacle lie between the current position and the stop?
+        offset = obstacle - current_position
+        if offset % step == 0 and 0 < offset // step <= (stop - current_position) // step:
+            stop = obstacle - step
+        elif cells[stop + step] == OUTSIDE:
+            # Guard leaves the map
+            return False
+
+        # Loops can only be closed at a turn, so only turn states are recorded
+        state = stop * 4 + current_direction
+        if marks[state] == generation:
             # The guard is stuck in a loop
-            grid[obstacle[0]][obstacle[1]] = '.'  # Restore the grid
             return True
-        visited_states.add(state)
+        marks[state] = generation
 
-        x, y = current_position
-        next_position = (x + current_direction[0], y + current_direction[1])
+        current_position = stop
+        current_direction = turn_right(current_direction)
+
+
+def trace_patrol(grid, start_position, start_direction):
+    """
+    Follow the guard's unobstructed patrol and record where each cell is first entered.
+
+    Parameters:
+    - grid: The lab map as a Grid.
+    - start_position: The cell index of the guard's initial position.
+    - start_direction: The initial direction of the guard as an index into grid.directions.
+
+    Returns:
+    - A list of (cell, position, direction) tuples in patrol order, one per
+      visited cell except the start: the guard stood at `position` facing
+      `direction` right before stepping onto `cell` for the first time.
+
+    Raises:
+    - ValueError if the guard patrols in a loop instead of leaving the map.
+    """
+    cells = grid.cells
+    steps = grid.directions
+    visited = bytearray(len(cells))
+    # Turn states encoded as `cell_index * 4 + direction`, to detect a patrol that never ends
+    turn_states = bytearray(len(cells) * 4)
+    visited[start_position] = 1
+    current_position = start_position
+    current_direction = start_direction
+    first_entries = []
+
+    while True:
+        next_position = current_position + steps[current_direction]
 
         # Check if the next position is out of bounds
-        if not (0 <= next_position[0] < rows and 0 <= next_position[1] < cols):
-            grid[obstacle[0]][obstacle[1]] = '.'  # Restore the grid
-            return False
+        if cells[next_position] == OUTSIDE:
+            # Guard leaves the map
+            return first_entries
 
         # Check if the next position is obstructed
-        if grid[next_position[0]][next_position[1]] == '#':
+        if cells[next_position] == OBSTACLE:
+            state = current_position * 4 + current_direction
+            if turn_states[state]:
+                raise ValueError("The guard patrols in a loop and never leaves the map")
+            turn_states[state] = 1
             # Turn right if there's an obstacle
             current_direction = turn_right(current_direction)
         else:
+            if not visited[next_position]:
+                visited[next_position] = 1
+                first_entries.append((next_position, current_position, current_direction))
             # Move forward
             current_position = next_position
 
@@ -84,46 +189,128 @@ def find_loop_causing_positions(grid, start_position, start_direction):
     """
     Find all positions where adding an obstacle would cause the guard to get stuck in a loop.
 
+    Only cells on the guard's original patrol can change it. Until the guard
+    first reaches such a cell, the patrol is the same with or without the
+    obstacle, so each simulation resumes right before that moment.
+
     Parameters:
-    - grid: The lab map as a list of lists.
-    - start_position: The initial position of the guard as (row, col).
-    - start_direction: The initial direction of the guard as (row_offset, col_offset).
+    - grid: The lab map as a Grid.
+    - start_position: The cell index of the guard's initial position.
+    - start_direction: The initial direction of the guard as an index into grid.directions.
 
     Returns:
     - A set of all positions (row, col) that would cause a loop.
     """
-    rows, cols = len(grid), len(grid[0])
+    jumps = build_jump_table(grid)
+    states = StateMarks(len(grid.cells))
     loop_positions = set()
 
-    for x in range(rows):
-        for y in range(cols):
-            # Skip if the position is already obstructed or is the guard's starting position
-            if grid[x][y] == '#' or (x, y) == start_position:
-                continue
-
-            # Check if adding an obstacle here causes a loop
-            if simulate_with_obstacle(grid, start_position, start_direction, (x, y)):
-                loop_positions.add((x, y))
+    for index, position, direction in trace_patrol(grid, start_position, start_direction):
+        # Check if adding an obstacle here causes a loop
+        if simulate_with_obstacle(grid, position, direction, index, jumps, states):
+            loop_positions.add(grid.position(index))
 
     return loop_positions
 
 
+# Grid and jump table of a worker process, attached to the shared memory block
+_shared_state = None
+
+
+def _attach_shared_grid(name, rows, cols, padding, size):
+    """
+    Worker initializer: attach to the shared memory block written by
+    find_loop_causing_positions_parallel. The jump table comes first, as
+    4 * size native ints, followed by the grid's `size` cells.
+    """
+    global _shared_state
+    block = shared_memory.SharedMemory(name=name)
+    # Workers only read the block, so they get read-only views of it
+    memory = block.buf.toreadonly()
+    table_size = 4 * size * array('i').itemsize
+    table = memory[:table_size].cast('i')
+    jumps = [table[direction * size:(direction + 1) * size] for direction in range(4)]
+    grid = Grid.from_buffer(memory[table_size:table_size + size], rows, cols, padding)
+    # The block is kept referenced, as its memory is unmapped once it is closed
+    _shared_state = (block, grid, jumps, StateMarks(size))
+
+
+def _find_loops_in_chunk(candidates):
+    _, grid, jumps, states = _shared_state
+    return [
+        index for index, position, direction in candidates
+        if simulate_with_obstacle(grid, position, direction, index, jumps, states)
+    ]
+
+
+def find_loop_causing_positions_parallel(grid, start_position, start_direction, workers=None):
+    """
+    Multi-process variant of find_loop_causing_positions.
+
+    The grid and its jump table are copied once into a shared memory block
+    that every worker maps read-only, and the candidate obstacles of the
+    patrol are distributed across the workers in chunks. Only the candidates
+    and the indices of the loop-causing ones pass between the processes.
+
+    Parameters:
+    - grid: The lab map as a Grid.
+    - start_position: The cell index of the guard's initial position.
+    - start_direction: The initial direction of the guard as an index into grid.directions.
+    - workers: The number of worker processes (default: one per CPU).
+
+    Returns:
+    - A set of all positions (row, col) that would cause a loop.
+    """
+    workers = workers or os.cpu_count()
+    candidates = trace_patrol(grid, start_position, start_direction)
+    size = len(grid.cells)
+
+    table = array('i')
+    for jump in build_jump_table(grid):
+        table.extend(jump)
+    table = table.tobytes()
+
+    block = shared_memory.SharedMemory(create=True, size=len(table) + size)
+    try:
+        block.buf[:len(table)] = table
+        block.buf[len(table):len(table) + size] = grid.cells
+
+        # A few chunks per worker even out the differing simulation lengths
+        chunk_size = max(1, len(candidates) // (workers * 4))
+        chunks = [candidates[i:i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_shared_grid,
+            initargs=(block.name, grid.rows, grid.cols, grid.padding, size),
+        ) as executor:
+            return {grid.position(index) for loops in executor.map(_find_loops_in_chunk, chunks) for index in loops}
+    finally:
+        block.close()
+        block.unlink()
+
+
 def main():
     import sys
 
     # Ensure the user provides a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python guard_patrol_part2.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != '--parallel'):
+        print("Usage: python guard_patrol_part2.py <input_file> [--parallel]")
         sys.exit(1)
 
     file_path = sys.argv[1]
+    parallel = len(sys.argv) == 3
 
     try:
         # Parse the input map
         grid, start_position, start_direction = parse_map(file_path)
 
         # Find all loop-causing positions
-        loop_positions = find_loop_causing_positions(grid, start_position, start_direction)
+        if parallel:
+            # Spread the candidate obstacles over one process per CPU
+            loop_positions = find_loop_causing_positions_parallel(grid, start_position, start_direction)
+        else:
+            loop_positions = find_loop_causing_positions(grid, start_position, start_direction)
 
         # Output the result
         print(f"There are {len(loop_positions)} positions where an obstruction would cause a loop.")
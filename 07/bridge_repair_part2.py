@@ -1,75 +1,207 @@
-from itertools import product
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
-def parse_input(file_path):
+CHUNK_SIZE = 1000  # Equations per task in the parallel mode
+
+
+def iter_equations(file_path):
     """
-    Parse the input file and return the equations as a list of tuples.
-    Each tuple contains the target value and a list of numbers.
+    Parse the input file lazily, yielding one (target, numbers) tuple per equation.
     """
-    equations = []
     with open(file_path, 'r') as file:
         for line in file:
             if line.strip():
                 target, numbers = line.split(":")
                 target = int(target.strip())
                 numbers = list(map(int, numbers.strip().split()))
-                equations.append((target, numbers))
-    return equations
+                yield target, numbers
+
+
+def parse_input(file_path):
+    """
+    Parse the input file and return the equations as a list of tuples.
+    Each tuple contains the target value and a list of numbers.
+    """
+    return list(iter_equations(file_path))
+
+
+def concat_magnitude(number):
+    """
+    Return the power of ten that `x || number` shifts x by, i.e.
+    10 ** (number of digits of number).
+    """
+    magnitude = 10
+    while magnitude <= number:
+        magnitude *= 10
+    return magnitude
 
 
 def evaluate_equation_with_concat(target, numbers):
     """
     Check if any combination of operators can make the numbers produce the target value.
     Operators are evaluated left-to-right without precedence.
+
+    The operators are undone from the right: the last one can only be `||`
+    if the value ends with the digits of the last number, only `*` if the
+    value is divisible by it, and only `+` if the value is at least the last
+    number. Most branches end after a single check, instead of evaluating all
+    3^(n-1) operator combinations.
     """
-    # Number of operators needed for the given numbers
-    n_operators = len(numbers) - 1
-
-    # Generate all possible operator combinations (e.g., ['+', '*', '||'])
-    for operators in product(['+', '*', '||'], repeat=n_operators):
-        # Evaluate the expression left-to-right
-        result = numbers[0]
-        for i, op in enumerate(operators):
-            if op == '+':
-                result += numbers[i + 1]
-            elif op == '*':
-                result *= numbers[i + 1]
-            elif op == '||':
-                result = int(str(result) + str(numbers[i + 1]))
-
-        # Check if the result matches the target value
-        if result == target:
+    magnitudes = [concat_magnitude(number) for number in numbers]
+
+    def can_produce(value, count):
+        # Can the first `count` numbers produce the value?
+        last = numbers[count - 1]
+        if count == 1:
+            return value == last
+        remainder = value - last
+        magnitude = magnitudes[count - 1]
+        if remainder >= 0 and remainder % magnitude == 0 and can_produce(remainder // magnitude, count - 1):
             return True
+        if last and value % last == 0 and can_produce(value // last, count - 1):
+            return True
+        if not last and not value:
+            return True  # Multiplying by zero gives zero whatever comes before
+        return remainder >= 0 and can_produce(remainder, count - 1)
 
-    return False
+    return can_produce(target, len(numbers))
 
 
-def calculate_calibration_result_with_concat(equations):
+def evaluate_equation_with_concat_dfs(target, numbers, witness=False):
+    """
+    Forward variant of evaluate_equation_with_concat: a depth-first search over
+    the operators, so all combinations sharing a prefix share its evaluation.
+    A branch is dropped once its value exceeds the target, as no operator
+    makes a value smaller unless a zero follows. The (value, count) states
+    that cannot reach the target are cached, so a value reached again by
+    another prefix is not searched twice.
+
+    Returns True or False, or with `witness` the list of operators producing
+    the target (e.g. ['+', '*']) or None.
+    """
+    magnitudes = [concat_magnitude(number) for number in numbers]
+    # Index of the last zero; only after it do the values never decrease
+    last_zero = max((i for i, number in enumerate(numbers) if number == 0), default=-1)
+    dead_ends = set()
+    operators = []
+
+    def search(value, count):
+        if count == len(numbers):
+            return value == target
+        if value > target and count > last_zero:
+            return False
+        if (value, count) in dead_ends:
+            return False
+        number = numbers[count]
+        for operator, result in (
+            ('+', value + number),
+            ('*', value * number),
+            ('||', value * magnitudes[count] + number),
+        ):
+            operators.append(operator)
+            if search(result, count + 1):
+                return True
+            operators.pop()
+        dead_ends.add((value, count))
+        return False
+
+    found = search(numbers[0], 1)
+    if witness:
+        return operators if found else None
+    return found
+
+
+def calculate_calibration_result_with_concat(equations, evaluate=evaluate_equation_with_concat):
     """
     Determine the total calibration result by summing the target values of valid equations.
     """
     total_calibration_result = 0
     for target, numbers in equations:
-        if evaluate_equation_with_concat(target, numbers):
+        if evaluate(target, numbers):
             total_calibration_result += target
     return total_calibration_result
 
 
+def pack_equations(equations):
+    """
+    Pack equations into one flat array of 64-bit integers: per equation the
+    target, the count of its numbers and the numbers. An array is sent to
+    another process as its raw bytes, far smaller than a list of tuples.
+
+    Targets grow quickly through `||`, so a chunk with a value beyond 64 bits
+    is returned as the plain list of (target, numbers) tuples instead.
+    """
+    packed = array('q')
+    try:
+        for target, numbers in equations:
+            packed.append(target)
+            packed.append(len(numbers))
+            packed.extend(numbers)
+    except OverflowError:
+        return list(equations)
+    return packed
+
+
+def unpack_equations(packed):
+    """
+    Yield the (target, numbers) tuples of an array from pack_equations,
+    or of a chunk it left unpacked.
+    """
+    if not isinstance(packed, array):
+        yield from packed
+        return
+    index = 0
+    while index < len(packed):
+        count = packed[index + 1]
+        yield packed[index], packed[index + 2:index + 2 + count].tolist()
+        index += 2 + count
+
+
+def calculate_packed_calibration_result_with_concat(packed):
+    return calculate_calibration_result_with_concat(unpack_equations(packed))
+
+
+def calculate_calibration_result_with_concat_parallel(file_path, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Multi-process variant of calculate_calibration_result_with_concat for large inputs.
+    The file is parsed as a stream: every `chunk_size` equations are packed
+    and submitted as soon as they are read, so the workers solve while the
+    rest of the file is still being parsed. The partial sums of the chunks
+    are added up at the end.
+    """
+    workers = workers or os.cpu_count()
+    equations = iter_equations(file_path)
+    futures = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while chunk := list(islice(equations, chunk_size)):
+            futures.append(executor.submit(calculate_packed_calibration_result_with_concat, pack_equations(chunk)))
+        return sum(future.result() for future in futures)
+
+
 def main():
     import sys
 
     # Ensure the user provides a file path as an argument
-    if len(sys.argv) != 2:
-        print("Usage: python bridge_repair_part2.py <input_file>")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] not in ('--dfs', '--parallel')):
+        print("Usage: python bridge_repair_part2.py <input_file> [--dfs | --parallel]")
         sys.exit(1)
 
     file_path = sys.argv[1]
+    mode = sys.argv[2] if len(sys.argv) == 3 else None
 
     try:
-        # Parse the input file
-        equations = parse_input(file_path)
-
-        # Calculate the total calibration result with concatenation
-        result = calculate_calibration_result_with_concat(equations)
+        if mode == '--parallel':
+            # Parse the input file in chunks that one process per CPU solves meanwhile
+            result = calculate_calibration_result_with_concat_parallel(file_path)
+        else:
+            # Parse the input file
+            equations = parse_input(file_path)
+
+            # Calculate the total calibration result with concatenation
+            evaluate = evaluate_equation_with_concat_dfs if mode == '--dfs' else evaluate_equation_with_concat
+            result = calculate_calibration_result_with_concat(equations, evaluate)
 
         print(f"The total calibration result is: {result}")
 
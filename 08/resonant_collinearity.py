@@ -1,19 +1,26 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.grid import Grid
+
+
 def parse_map(file_path):
     """
     Parse the input file to extract the map and locate all antennas with their positions.
     Returns a dictionary with frequencies as keys and lists of (row, col) positions as values.
     """
     antennas = {}
-    with open(file_path, 'r') as file:
-        grid = [line.strip() for line in file]
-
-    for r, row in enumerate(grid):
-        for c, char in enumerate(row):
-            if char != '.':
-                if char not in antennas:
-                    antennas[char] = []
-                antennas[char].append((r, c))
-    
+    grid = Grid.from_file(file_path)
+
+    for index in grid.indices():
+        char = grid[index]
+        if char != '.':
+            if char not in antennas:
+                antennas[char] = []
+            antennas[char].append(grid.position(index))
+
     return grid, antennas
 
 
@@ -21,7 +28,7 @@ def calculate_antinodes(grid, antennas):
     """
     Calculate all unique antinode positions within the grid bounds.
     """
-    rows, cols = len(grid), len(grid[0])
+    rows, cols = grid.rows, grid.cols
     antinode_positions = set()
 
     for frequency, positions in antennas.items():
@@ -1,5 +1,11 @@
+import os
+import sys
 from itertools import combinations
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.grid import Grid
+
 
 def parse_map(file_path):
     """
@@ -7,16 +13,15 @@ def parse_map(file_path):
     Returns a dictionary with frequencies as keys and lists of (row, col) positions as values.
     """
     antennas = {}
-    with open(file_path, 'r') as file:
-        grid = [line.strip() for line in file]
-
-    for r, row in enumerate(grid):
-        for c, char in enumerate(row):
-            if char != '.':
-                if char not in antennas:
-                    antennas[char] = []
-                antennas[char].append((r, c))
-    
+    grid = Grid.from_file(file_path)
+
+    for index in grid.indices():
+        char = grid[index]
+        if char != '.':
+            if char not in antennas:
+                antennas[char] = []
+            antennas[char].append(grid.position(index))
+
     return grid, antennas
 
 
@@ -24,7 +29,7 @@ def calculate_harmonic_antinodes(grid, antennas):
     """
     Calculate all unique antinode positions within the grid bounds, considering resonant harmonics.
     """
-    rows, cols = len(grid), len(grid[0])
+    rows, cols = grid.rows, grid.cols
     antinode_positions = set()
 
     for frequency, positions in antennas.items():
@@ -1,39 +1,44 @@
-def parse_map(input_file):
-    """
-    Parse the input file into a 2D grid of heights.
-    """
-    with open(input_file, 'r') as file:
-        return [[int(c) for c in line.strip()] for line in file if line.strip()]
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
+from aoc.grid import Grid
 
-def is_within_bounds(x, y, grid):
+TRAILHEAD = ord('0')
+SUMMIT = ord('9')
+
+
+def parse_map(input_file):
     """
-    Check if a position (x, y) is within the bounds of the grid.
+    Parse the input file into a grid of heights, stored as the digit characters '0'-'9'.
+    Steps off the map land on the padding, which never matches a height.
     """
-    return 0 <= x < len(grid) and 0 <= y < len(grid[0])
+    return Grid.from_file(input_file)
 
 
-def dfs_count_paths(x, y, grid, current_height, visited):
+def dfs_count_paths(index, grid, current_height, visited):
     """
-    Perform a DFS to count all distinct paths from (x, y) to any 9.
+    Perform a DFS to count all distinct paths from the cell at `index` to any 9.
     """
-    if not is_within_bounds(x, y, grid) or (x, y) in visited or grid[x][y] != current_height:
+    cells = grid.cells
+    if index in visited or cells[index] != current_height:
         return 0
 
     # If we reach a height of 9, this is a valid path
-    if current_height == 9:
+    if current_height == SUMMIT:
         return 1
 
-    visited.add((x, y))  # Mark current position as visited
+    visited.add(index)  # Mark current position as visited
 
     # Explore all cardinal directions
     path_count = 0
-    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        nx, ny = x + dx, y + dy
-        if is_within_bounds(nx, ny, grid) and grid[nx][ny] == current_height + 1:
-            path_count += dfs_count_paths(nx, ny, grid, current_height + 1, visited)
+    for step in grid.directions:
+        neighbor = index + step
+        if cells[neighbor] == current_height + 1:
+            path_count += dfs_count_paths(neighbor, grid, current_height + 1, visited)
 
-    visited.remove((x, y))  # Backtrack
+    visited.remove(index)  # Backtrack
 
     return path_count
 
@@ -44,11 +49,10 @@ def calculate_total_trailhead_ratings(grid):
     """
     total_rating = 0
 
-    for x in range(len(grid)):
-        for y in range(len(grid[0])):
-            if grid[x][y] == 0:  # Found a trailhead
-                visited = set()
-                total_rating += dfs_count_paths(x, y, grid, 0, visited)
+    for index in grid.indices():
+        if grid.cells[index] == TRAILHEAD:  # Found a trailhead
+            visited = set()
+            total_rating += dfs_count_paths(index, grid, TRAILHEAD, visited)
 
     return total_rating
 
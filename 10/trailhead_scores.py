@@ -1,48 +1,54 @@
-def parse_map(input_file):
-    """
-    Parse the input file into a 2D grid of heights.
-    """
-    with open(input_file, 'r') as file:
-        return [[int(c) for c in line.strip()] for line in file if line.strip()]
+import os
+import sys
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
+from aoc.grid import Grid
 
-def is_within_bounds(x, y, grid):
+TRAILHEAD = ord('0')
+SUMMIT = ord('9')
+
+
+def parse_map(input_file):
     """
-    Check if a position (x, y) is within the bounds of the grid.
+    Parse the input file into a grid of heights, stored as the digit characters '0'-'9'.
+    Steps off the map land on the padding, which never matches a height.
     """
-    return 0 <= x < len(grid) and 0 <= y < len(grid[0])
+    return Grid.from_file(input_file)
 
 
-def bfs_from_trailhead(x, y, grid):
+def bfs_from_trailhead(start, grid):
     """
-    Perform a BFS from a given trailhead (x, y) to count reachable '9's.
+    Perform a BFS from the trailhead at index `start` to count reachable '9's.
     """
+    cells = grid.cells
     visited = set()  # Track visited positions
-    queue = [(x, y, 0)]  # (current_x, current_y, current_height)
+    queue = deque([start])
     reachable_nines = set()
 
     while queue:
-        cx, cy, current_height = queue.pop(0)
+        index = queue.popleft()
 
         # If this position was already visited, skip it
-        if (cx, cy) in visited:
+        if index in visited:
             continue
 
-        visited.add((cx, cy))
+        visited.add(index)
+        current_height = cells[index]
 
         # If the current height is 9, count it
-        if current_height == 9:
-            reachable_nines.add((cx, cy))
+        if current_height == SUMMIT:
+            reachable_nines.add(index)
             continue
 
         # Explore neighboring positions
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = cx + dx, cy + dy
+        for step in grid.directions:
+            neighbor = index + step
 
-            if is_within_bounds(nx, ny, grid) and (nx, ny) not in visited:
-                # Ensure the next height is exactly one greater
-                if grid[nx][ny] == current_height + 1:
-                    queue.append((nx, ny, grid[nx][ny]))
+            # Ensure the next height is exactly one greater
+            if neighbor not in visited and cells[neighbor] == current_height + 1:
+                queue.append(neighbor)
 
     return len(reachable_nines)
 
@@ -53,10 +59,9 @@ def calculate_total_trailhead_scores(grid):
     """
     total_score = 0
 
-    for x in range(len(grid)):
-        for y in range(len(grid[0])):
-            if grid[x][y] == 0:  # Found a trailhead
-                total_score += bfs_from_trailhead(x, y, grid)
+    for index in grid.indices():
+        if grid.cells[index] == TRAILHEAD:  # Found a trailhead
+            total_score += bfs_from_trailhead(index, grid)
 
     return total_score
 
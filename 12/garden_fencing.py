@@ -1,44 +1,41 @@
+import os
 import sys
 from collections import deque
 
-def get_neighbors(r, c, rows, cols):
-    """Yield the 4-directional neighbors of (r,c)."""
-    directions = [(1,0),(-1,0),(0,1),(0,-1)]
-    for dr, dc in directions:
-        nr, nc = r+dr, c+dc
-        if 0 <= nr < rows and 0 <= nc < cols:
-            yield nr, nc
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.grid import Grid
 
 def find_regions(grid):
     """
     Find all contiguous regions of the same character in the grid.
     Returns a list of regions, where each region is:
     {
-      'cells': [(r,c), ...],
-      'char': 'X'
+      'cells': [index, ...],
+      'char': ord('X')
     }
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    visited = [[False]*cols for _ in range(rows)]
+    cells = grid.cells
+    visited = bytearray(len(cells))
     regions = []
 
-    for r in range(rows):
-        for c in range(cols):
-            if not visited[r][c]:
-                char = grid[r][c]
-                q = deque()
-                q.append((r,c))
-                visited[r][c] = True
-                cells = []
-                while q:
-                    rr, cc = q.popleft()
-                    cells.append((rr, cc))
-                    for nr, nc in get_neighbors(rr, cc, rows, cols):
-                        if not visited[nr][nc] and grid[nr][nc] == char:
-                            visited[nr][nc] = True
-                            q.append((nr, nc))
-                regions.append({'cells': cells, 'char': char})
+    for index in grid.indices():
+        if not visited[index]:
+            char = cells[index]
+            q = deque()
+            q.append(index)
+            visited[index] = True
+            region_cells = []
+            while q:
+                current = q.popleft()
+                region_cells.append(current)
+                for step in grid.directions:
+                    neighbor = current + step
+                    # The padding never matches a plant, so no bounds check is needed
+                    if not visited[neighbor] and cells[neighbor] == char:
+                        visited[neighbor] = True
+                        q.append(neighbor)
+            regions.append({'cells': region_cells, 'char': char})
     return regions
 
 def compute_perimeter(grid, region):
@@ -47,15 +44,13 @@ def compute_perimeter(grid, region):
     For each cell in the region, count edges that are exposed 
     (either out of bounds or adjacent to a different character).
     """
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    region_cells = set(region['cells'])
+    cells = grid.cells
     char = region['char']
     perimeter = 0
-    for (r,c) in region['cells']:
+    for index in region['cells']:
         # Check each of the 4 directions
-        for nr, nc in [(r+1,c),(r-1,c),(r,c+1),(r,c-1)]:
-            if not (0 <= nr < rows and 0 <= nc < cols) or grid[nr][nc] != char:
+        for step in grid.directions:
+            if cells[index + step] != char:
                 perimeter += 1
     return perimeter
 
@@ -80,8 +75,7 @@ def main():
     input_file = sys.argv[1]
 
     try:
-        with open(input_file, 'r') as file:
-            grid = [list(line.strip()) for line in file if line.strip()]
+        grid = Grid.from_file(input_file)
 
         total_price = calculate_total_fence_price(grid)
 
@@ -1,5 +1,10 @@
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.grid import Grid
+
 def read_input(filename):
     try:
         with open(filename, 'r') as f:
@@ -25,66 +30,60 @@ def transform_map(arr):
     return arr
 
 def find_robot(grid, scaled):
-    n, m = len(grid), len(grid[0])
-    if scaled:
-        # Robot = '@.'
-        for i in range(1, n-1):
-            j = 1
-            while j < m-1:
-                if j+1 < m and grid[i][j] == '@' and grid[i][j+1] == '.':
-                    return i, j
-                j += 1
-    else:
-        # Robot = '@'
-        for i in range(1, n-1):
-            for j in range(1, m-1):
-                if grid[i][j] == '@':
-                    return i, j
+    # The robot is '@' in both layouts ('@.' once scaled)
+    robot = grid.find('@')
+    if robot is not None:
+        return robot
     print("Error: Robot not found.")
     sys.exit(1)
 
 def simulate_moves(grid, moves, scaled):
-    n, m = len(grid), len(grid[0])
-    x, y = find_robot(grid, scaled)
+    cells = grid.cells
+    robot = find_robot(grid, scaled)
 
-    d = {"<": (0, -1), ">": (0, 1), "^": (-1, 0), "v": (1, 0)}
+    up, right, down, left = grid.directions
+    d = {"<": left, ">": right, "^": up, "v": down}
+    wall, box, box_left, box_right = b"#O[]"
     for move in moves:
-        dx, dy = d[move]
-        to_move = [(x, y)]
+        step = d[move]
+        to_move = [robot]
+        queued = {robot}
         flag = True
-        for (i2, j2) in to_move:
-            nx, ny = i2 + dx, j2 + dy
-            if (nx, ny) not in to_move:
-                if grid[nx][ny] == "#":
+        for index in to_move:
+            target = index + step
+            if target not in queued:
+                if cells[target] == wall:
                     # wall
                     flag = False
                     break
                 if scaled:
                     # Boxes: '[]'
-                    if grid[nx][ny] == "[":
-                        to_move.extend([(nx, ny), (nx, ny + 1)])
-                    elif grid[nx][ny] == "]":
-                        to_move.extend([(nx, ny), (nx, ny - 1)])
+                    if cells[target] == box_left:
+                        to_move.extend([target, target + 1])
+                        queued.update((target, target + 1))
+                    elif cells[target] == box_right:
+                        to_move.extend([target, target - 1])
+                        queued.update((target, target - 1))
                 else:
                     # Unscaled: 'O' for boxes
-                    if grid[nx][ny] == "O":
-                        to_move.append((nx, ny))
+                    if cells[target] == box:
+                        to_move.append(target)
+                        queued.add(target)
 
         if flag:
-            for (ii, jj) in reversed(to_move):
-                grid[ii + dx][jj + dy], grid[ii][jj] = grid[ii][jj], grid[ii + dx][jj + dy]
-            x, y = x + dx, y + dy
+            for index in reversed(to_move):
+                cells[index + step], cells[index] = cells[index], cells[index + step]
+            robot += step
 
     return grid
 
 def compute_gps_sum(grid, scaled):
-    n, m = len(grid), len(grid[0])
     box_char = '[' if scaled else 'O'
     total = 0
-    for i in range(1, n-1):
-        for j in range(1, m-1):
-            if grid[i][j] == box_char:
-                total += 100*i + j
+    for index in grid.indices():
+        if grid[index] == box_char:
+            i, j = grid.position(index)
+            total += 100*i + j
     return total
 
 def main():
@@ -105,7 +104,7 @@ def main():
     if scaled:
         arr = transform_map(arr)
 
-    grid = [list(line) for line in arr.split("\n")]
+    grid = Grid.from_lines(arr.split("\n"))
     # Simulate moves
     grid = simulate_moves(grid, moves, scaled)
     # Compute and print result
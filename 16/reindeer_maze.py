@@ -1,45 +1,35 @@
+import os
 import sys
 import heapq
 
-def parse_maze(filename):
-    with open(filename, 'r') as f:
-        maze = [list(line.rstrip('\n')) for line in f]
-    return maze
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
-def find_positions(maze):
-    start = None
-    end = None
-    for r, row in enumerate(maze):
-        for c, ch in enumerate(row):
-            if ch == 'S':
-                start = (r, c)
-            elif ch == 'E':
-                end = (r, c)
-    return start, end
-
-def in_bounds(r, c, maze):
-    return 0 <= r < len(maze) and 0 <= c < len(maze[0])
-
-def is_wall(r, c, maze):
-    return maze[r][c] == '#'
+from aoc.grid import Grid, OUTSIDE
 
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: python reindeer_maze.py input.txt")
-        sys.exit(1)
+WALL = ord('#')
 
-    filename = sys.argv[1]
-    maze = parse_maze(filename)
-    start, end = find_positions(maze)
-    if start is None or end is None:
-        print("Error: Start or End not found in the maze.")
-        sys.exit(1)
+def parse_maze(filename):
+    return Grid.from_file(filename)
 
+def find_positions(maze):
+    return maze.find('S'), maze.find('E')
+
+def is_open(index, maze):
+    # Padding cells count as walls, so no separate bounds check is needed
+    return maze.cells[index] not in (WALL, OUTSIDE)
+
+def find_lowest_scores(maze, start, end):
+    """
+    Run Dijkstra over states from the start tile facing East.
+    A state packs a tile index and a direction into index * 4 + direction.
+    Returns the score of every reached state, the minimal score at the end tile
+    (None if unreachable) and the end states reached with that score.
+    """
     # Directions: 0=North,1=East,2=South,3=West
     # Start facing East (direction=1)
-    start_state = (start[0], start[1], 1)
+    start_state = start * 4 + 1
     
-    moves = [(-1,0),(0,1),(1,0),(0,-1)]
+    moves = maze.directions
     # Dijkstra for part one
     dist = {}
     dist[start_state] = 0
@@ -50,22 +40,23 @@ def main():
     end_states = []
 
     while pq:
-        cost, (r,c,d) = heapq.heappop(pq)
-        if dist[(r,c,d)] < cost:
+        cost, state = heapq.heappop(pq)
+        if dist[state] < cost:
             continue
-        if (r,c) == end:
+        index, d = divmod(state, 4)
+        if index == end:
             if end_min_dist is None or cost < end_min_dist:
                 end_min_dist = cost
-                end_states = [(r,c,d)]
+                end_states = [state]
             elif cost == end_min_dist:
-                end_states.append((r,c,d))
+                end_states.append(state)
             continue
 
         # forward
-        nr, nc = r+moves[d][0], c+moves[d][1]
-        if in_bounds(nr, nc, maze) and not is_wall(nr, nc, maze):
+        forward = index + moves[d]
+        if is_open(forward, maze):
             new_cost = cost + 1
-            new_state = (nr, nc, d)
+            new_state = forward * 4 + d
             if new_state not in dist or new_cost < dist[new_state]:
                 dist[new_state] = new_cost
                 heapq.heappush(pq, (new_cost, new_state))
@@ -73,7 +64,7 @@ def main():
         # turn left
         left_d = (d-1)%4
         left_cost = cost + 1000
-        left_state = (r,c,left_d)
+        left_state = index * 4 + left_d
         if left_state not in dist or left_cost < dist[left_state]:
             dist[left_state] = left_cost
             heapq.heappush(pq, (left_cost, left_state))
@@ -81,19 +72,19 @@ def main():
         # turn right
         right_d = (d+1)%4
         right_cost = cost + 1000
-        right_state = (r,c,right_d)
+        right_state = index * 4 + right_d
         if right_state not in dist or right_cost < dist[right_state]:
             dist[right_state] = right_cost
             heapq.heappush(pq, (right_cost, right_state))
 
-    if end_min_dist is None:
-        print("No path found.")
-        return
+    return dist, end_min_dist, end_states
 
-    # Print minimal score
-    print(f"The minimal score is: {end_min_dist}")
-
-    # Part two: find all tiles on minimal paths
+def count_best_path_tiles(maze, dist, end_states):
+    """
+    Walk back from the end states along predecessors that lie on a minimal path
+    and count the distinct tiles visited.
+    """
+    moves = maze.directions
     stack = []
     visited_states = set()
     for es in end_states:
@@ -103,15 +94,16 @@ def main():
     on_path_tiles = set()
 
     while stack:
-        r,c,d = stack.pop()
-        on_path_tiles.add((r,c))
-        cost = dist[(r,c,d)]
+        state = stack.pop()
+        index, d = divmod(state, 4)
+        on_path_tiles.add(index)
+        cost = dist[state]
 
         # Check forward predecessor
-        # If forward: prev_state=(r-dr,c-dc,d) with dist[prev]+1=cost
-        rr, cc = r - moves[d][0], c - moves[d][1]
-        if in_bounds(rr, cc, maze) and not is_wall(rr, cc, maze):
-            prev_state = (rr, cc, d)
+        # If forward: prev_state=(index-move,d) with dist[prev]+1=cost
+        previous = index - moves[d]
+        if is_open(previous, maze):
+            prev_state = previous * 4 + d
             if prev_state in dist:
                 if dist[prev_state] + 1 == cost:
                     if prev_state not in visited_states:
@@ -120,7 +112,7 @@ def main():
 
         # Check turn left predecessor
         prev_d_left = (d+1)%4
-        prev_state_left = (r,c,prev_d_left)
+        prev_state_left = index * 4 + prev_d_left
         if prev_state_left in dist:
             if dist[prev_state_left] + 1000 == cost:
                 if prev_state_left not in visited_states:
@@ -129,7 +121,7 @@ def main():
 
         # Check turn right predecessor
         prev_d_right = (d-1)%4
-        prev_state_right = (r,c,prev_d_right)
+        prev_state_right = index * 4 + prev_d_right
         if prev_state_right in dist:
             if dist[prev_state_right] + 1000 == cost:
                 if prev_state_right not in visited_states:
@@ -137,9 +129,34 @@ def main():
                     stack.append(prev_state_right)
 
     count = 0
-    for (rr,cc) in on_path_tiles:
-        if maze[rr][cc] != '#':
+    for index in on_path_tiles:
+        if maze.cells[index] != WALL:
             count += 1
+    return count
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python reindeer_maze.py input.txt")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    maze = parse_maze(filename)
+    start, end = find_positions(maze)
+    if start is None or end is None:
+        print("Error: Start or End not found in the maze.")
+        sys.exit(1)
+
+    dist, end_min_dist, end_states = find_lowest_scores(maze, start, end)
+
+    if end_min_dist is None:
+        print("No path found.")
+        return
+
+    # Print minimal score
+    print(f"The minimal score is: {end_min_dist}")
+
+    # Part two: find all tiles on minimal paths
+    count = count_best_path_tiles(maze, dist, end_states)
 
     # Print tiles count
     print(f"The number of tiles on best paths is: {count}")
@@ -1,5 +1,9 @@
+import os
 import sys
-from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from aoc.grid import Grid
 
 def parse_input(filename):
     """Parse input file to extract byte positions."""
@@ -10,43 +14,50 @@ def parse_input(filename):
 
 def simulate_corruption(grid_size, byte_positions, corrupted_count):
     """Simulate falling bytes and mark the grid as corrupted."""
-    grid = [['.' for _ in range(grid_size)] for _ in range(grid_size)]
+    grid = Grid(grid_size, grid_size)
     for x, y in byte_positions[:corrupted_count]:
-        grid[y][x] = '#'
+        grid[grid.index(y, x)] = '#'
     return grid
 
 def bfs_shortest_path(grid):
     """Find the shortest path using Breadth-First Search."""
-    n = len(grid)
-    start = (0, 0)
-    end = (n - 1, n - 1)
-    if grid[start[1]][start[0]] == '#' or grid[end[1]][end[0]] == '#':
+    cells = grid.cells
+    start = grid.index(0, 0)
+    end = grid.index(grid.rows - 1, grid.cols - 1)
+    free = ord('.')
+    if cells[start] != free or cells[end] != free:
         return -1  # No path if start or end is corrupted
 
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
-    queue = deque([(start, 0)])  # (position, steps)
-    visited = set()
-    visited.add(start)
-
-    while queue:
-        (x, y), steps = queue.popleft()
-        if (x, y) == end:
-            return steps
-
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < n and 0 <= ny < n and grid[ny][nx] == '.' and (nx, ny) not in visited:
-                visited.add((nx, ny))
-                queue.append(((nx, ny), steps + 1))
+    directions = grid.directions  # Up, Right, Down, Left
+    # Expand the search one distance level at a time
+    frontier = [start]
+    visited = bytearray(len(cells))
+    visited[start] = 1
+    steps = 0
+
+    while frontier:
+        next_frontier = []
+        for index in frontier:
+            if index == end:
+                return steps
+
+            for step in directions:
+                neighbor = index + step
+                # Padding cells are never free, so no bounds check is needed
+                if cells[neighbor] == free and not visited[neighbor]:
+                    visited[neighbor] = 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+        steps += 1
     
     return -1  # No path found
 
 def find_first_blocking_byte(grid_size, byte_positions):
     """Find the first byte that blocks the path to the exit."""
-    grid = [['.' for _ in range(grid_size)] for _ in range(grid_size)]
+    grid = Grid(grid_size, grid_size)
 
     for idx, (x, y) in enumerate(byte_positions):
-        grid[y][x] = '#'
+        grid[grid.index(y, x)] = '#'
         if bfs_shortest_path(grid) == -1:
             return x, y
 
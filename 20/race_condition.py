@@ -1,47 +1,42 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 from collections import deque
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
-def load_grid(input_file):
-    """Read the grid from input and extract valid spaces, start, and end points."""
-    spaces = set()
-    start = end = None
+from aoc.grid import Grid, OUTSIDE
 
-    for row_idx, line in enumerate(map(str.rstrip, input_file)):
-        for col_idx, char in enumerate(line):
-            if char == '#':
-                continue
-
-            position = (row_idx, col_idx)
-            spaces.add(position)
-
-            if char == 'S':
-                start = position
-            elif char == 'E':
-                end = position
+# The longest cheat supported; the grid is padded by as many cells so that
+# cheat targets never wrap around to another row or leave the cell array.
+MAX_CHEAT_LENGTH = 20
 
-    return spaces, start, end
 
-
-def get_adjacent_positions(row, col):
-    """Generate all valid neighbors for a given position."""
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    for dr, dc in directions:
-        yield row + dr, col + dc
+def load_grid(input_file, padding=MAX_CHEAT_LENGTH):
+    """Read the grid from input and locate the start and end points."""
+    grid = Grid.from_lines([line for line in map(str.strip, input_file) if line], padding)
+    return grid, grid.find('S'), grid.find('E')
 
 
 def compute_distances(grid, start):
-    """Perform BFS to calculate distances from the start position."""
+    """
+    Perform BFS to calculate distances from the start position.
+    Returns a list with the distance of every cell index, -1 where unreachable.
+    """
+    cells = grid.cells
+    wall = ord('#')
     queue = deque([start])
-    distances = {start: 0}
+    distances = [-1] * len(cells)
+    distances[start] = 0
 
     while queue:
         current = queue.popleft()
 
-        for neighbor in get_adjacent_positions(*current):
-            if neighbor in distances or neighbor not in grid:
+        for step in grid.directions:
+            neighbor = current + step
+            # Padding cells are sentinels, so they are never part of the track
+            if distances[neighbor] >= 0 or cells[neighbor] in (wall, OUTSIDE):
                 continue
 
             distances[neighbor] = distances[current] + 1
@@ -50,28 +45,35 @@ def compute_distances(grid, start):
     return distances
 
 
-def cheat_targets_within_range(row, col, max_range):
-    """Generate possible cheat endpoints within the given range."""
+def cheat_offsets_within_range(grid, max_range):
+    """Generate the index offsets of possible cheat endpoints within the given range."""
+    width = grid.width
     for distance in range(2, max_range + 1):
         for step in range(distance):
             remaining = distance - step
-            yield (row + remaining, col + step), distance
-            yield (row - remaining, col - step), distance
-            yield (row + step, col - remaining), distance
-            yield (row - step, col + remaining), distance
+            yield remaining * width + step, distance
+            yield -remaining * width - step, distance
+            yield step * width - remaining, distance
+            yield -step * width + remaining, distance
 
 
-def find_valid_cheats(start_distances, end_distances, max_distance, max_cheat_length=2):
+def find_valid_cheats(grid, start_distances, end_distances, max_distance, max_cheat_length=2):
     """Identify and count valid cheats that shorten the path."""
+    if max_cheat_length > grid.padding:
+        raise ValueError(f"Cheats of length {max_cheat_length} need a grid padding of at least that size")
+
+    offsets = list(cheat_offsets_within_range(grid, max_cheat_length))
     cheat_count = 0
 
-    for position, start_distance in start_distances.items():
-        for cheat_target, cheat_distance in cheat_targets_within_range(*position, max_cheat_length):
-            if cheat_target not in end_distances:
-                continue
+    for position, start_distance in enumerate(start_distances):
+        if start_distance < 0:
+            continue
 
-            total_distance = start_distance + cheat_distance + end_distances[cheat_target]
-            if total_distance <= max_distance:
+        # Cheats must save at least the difference to the allowed distance
+        budget = max_distance - start_distance
+        for offset, cheat_distance in offsets:
+            end_distance = end_distances[position + offset]
+            if 0 <= end_distance <= budget - cheat_distance:
                 cheat_count += 1
 
     return cheat_count
@@ -95,11 +97,11 @@ def main():
     max_allowed_distance = distances_from_start[end] - 100
 
     # Evaluate cheats for Part 1 (cheat length 2)
-    part1_result = find_valid_cheats(distances_from_start, distances_from_end, max_allowed_distance, max_cheat_length=2)
+    part1_result = find_valid_cheats(grid, distances_from_start, distances_from_end, max_allowed_distance, max_cheat_length=2)
     print(f"Result Part 1: {part1_result}")
 
     # Evaluate cheats for Part 2 (cheat length 20)
-    part2_result = find_valid_cheats(distances_from_start, distances_from_end, max_allowed_distance, max_cheat_length=20)
+    part2_result = find_valid_cheats(grid, distances_from_start, distances_from_end, max_allowed_distance, max_cheat_length=20)
     print(f"Result Part 2: {part2_result}")
 
 
@@ -41,13 +41,10 @@ def grids_fit(lock_grid, key_grid):
                 return False
     return True
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python day25.py <input.txt>")
-        sys.exit(1)
-    
-    filename = sys.argv[1]
-    
+def parse_input(filename):
+    """
+    Read the schematics from a file and split them into lock and key grids.
+    """
     # Read file lines, strip whitespace, ignore empty lines
     with open(filename, 'r') as f:
         raw = [line.strip() for line in f if line.strip()]
@@ -70,12 +67,29 @@ def main():
             # Not recognized as lock or key => raise or skip
             raise ValueError("Schematic doesn't match known lock/key format:\n" + "\n".join(block))
     
-    # Try all lock–key combinations
+    return locks, keys
+
+def count_fitting_pairs(locks, keys):
+    """
+    Count the lock–key combinations that do not overlap in any column.
+    """
     fit_count = 0
     for lock_grid in locks:
         for key_grid in keys:
             if grids_fit(lock_grid, key_grid):
                 fit_count += 1
+    return fit_count
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python day25.py <input.txt>")
+        sys.exit(1)
+    
+    filename = sys.argv[1]
+    locks, keys = parse_input(filename)
+    
+    # Try all lock–key combinations
+    fit_count = count_fitting_pairs(locks, keys)
     
     print(f"Number of fitting lock–key pairs: {fit_count}")
 
@@ -0,0 +1,7 @@
+"""
+Shared tooling for running the daily solutions in-process.
+
+The day folders (01/ ... 25/) are not importable packages, so the modules in
+this package load the solution scripts by file path and call their solving
+functions directly instead of going through each script's `main()`.
+"""
@@ -0,0 +1,157 @@
+"""
+Benchmark the parse and solve stages of every daily solution.
+
+Each selected day/part is parsed and solved `--repeat` times on its checked-in
+input and the fastest time of each stage is kept. With `--save` the timings
+become the new baseline; otherwise they are compared with the stored baseline
+and the run fails when a stage got slower than the allowed threshold.
+
+With the parsed-input cache enabled (the default) the parse stage measures
+loading the cached structure; use `--no-cache` to time the parsers themselves.
+
+Usage: python -m aoc.benchmark [--days 1 6 ...] [--repeat 3] [--save]
+                               [--baseline FILE] [--threshold 0.25]
+                               [--input input.txt] [--cache-dir DIR | --no-cache]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import NamedTuple
+
+from aoc.inputs import DEFAULT_CACHE_DIR
+from aoc.runner import ROOT, input_path, load_module, module_path, parse_input, select_solutions
+
+DEFAULT_BASELINE = os.path.join(ROOT, 'benchmark_baseline.json')
+STAGES = ('parse', 'solve')
+
+
+class Timing(NamedTuple):
+    day: int
+    part: int
+    module: str
+    parse: float
+    solve: float
+
+
+def benchmark_key(day, part):
+    return f"{day:02}.{part}"
+
+
+def benchmark_solution(solution, repeat=3, input_name='input.txt', root=ROOT, cache_dir=None):
+    """
+    Time the parse and solve stages of one solution.
+    The input is parsed again before every solve because several solvers
+    modify their input in place (e.g. days 6, 9 and 15).
+    """
+    module = load_module(module_path(solution, root))
+    file_path = input_path(solution, input_name, root)
+    parse_times = []
+    solve_times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parsed = parse_input(solution, module, file_path, cache_dir)
+        parse_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        solution.solve(module, parsed)
+        solve_times.append(time.perf_counter() - start)
+
+    return Timing(solution.day, solution.part, solution.module, min(parse_times), min(solve_times))
+
+
+def load_baseline(path):
+    """
+    Load a baseline written by `save_baseline`, or an empty one if it does not exist.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+def save_baseline(path, timings, baseline=None):
+    """
+    Store the timings as JSON, keeping entries of days that were not benchmarked.
+    """
+    baseline = dict(baseline or {})
+    for timing in timings:
+        baseline[benchmark_key(timing.day, timing.part)] = {
+            'module': timing.module,
+            'parse': timing.parse,
+            'solve': timing.solve,
+        }
+    with open(path, 'w') as file:
+        json.dump(dict(sorted(baseline.items())), file, indent=2)
+        file.write('\n')
+
+
+def find_regressions(timings, baseline, threshold=0.25, min_seconds=0.01):
+    """
+    Compare timings with the baseline.
+    A stage regresses when it is more than `threshold` (relative) slower than
+    its baseline and the difference exceeds `min_seconds`, which keeps timer
+    noise on millisecond-sized stages from failing the run.
+
+    Returns a list of (timing, stage, baseline_seconds, seconds) tuples.
+    """
+    regressions = []
+    for timing in timings:
+        reference = baseline.get(benchmark_key(timing.day, timing.part))
+        if reference is None:
+            continue
+        for stage in STAGES:
+            seconds = getattr(timing, stage)
+            if seconds > reference[stage] * (1 + threshold) and seconds - reference[stage] > min_seconds:
+                regressions.append((timing, stage, reference[stage], seconds))
+    return regressions
+
+
+def format_timing(timing, reference=None):
+    line = (f"Day {timing.day:02} part {timing.part} ({timing.module}): "
+            f"parse {timing.parse:.4f}s, solve {timing.solve:.4f}s")
+    if reference:
+        line += f"  (baseline parse {reference['parse']:.4f}s, solve {reference['solve']:.4f}s)"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Advent of Code 2024 solutions.")
+    parser.add_argument('--days', type=int, nargs='+', help="Only benchmark these days.")
+    parser.add_argument('--input', default='input.txt', help="Input file name inside each day folder.")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per solution; the fastest is kept.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON file.")
+    parser.add_argument('--save', action='store_true', help="Store the timings as the new baseline.")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed relative slowdown before a stage counts as regressed.")
+    parser.add_argument('--min-seconds', type=float, default=0.01,
+                        help="Ignore slowdowns smaller than this many seconds.")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Directory of the parsed-input cache.")
+    parser.add_argument('--no-cache', action='store_true', help="Always parse the inputs.")
+    args = parser.parse_args()
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    baseline = load_baseline(args.baseline)
+    timings = []
+    for solution in select_solutions(args.days):
+        timing = benchmark_solution(solution, args.repeat, args.input, cache_dir=cache_dir)
+        timings.append(timing)
+        print(format_timing(timing, baseline.get(benchmark_key(timing.day, timing.part))))
+
+    if args.save:
+        save_baseline(args.baseline, timings, baseline)
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    regressions = find_regressions(timings, baseline, args.threshold, args.min_seconds)
+    for timing, stage, reference, seconds in regressions:
+        print(f"Regression: day {timing.day:02} part {timing.part} {stage} "
+              f"took {seconds:.4f}s (baseline {reference:.4f}s)")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,555 @@
+"""
+Generate synthetic puzzle inputs of arbitrary size.
+
+Every day has a generator that produces an input in the same format as the
+checked-in `input.txt`. A scale of 1 is roughly the size of the real puzzle;
+higher scales grow the amount of data linearly (grids grow by sqrt(scale) per
+side, so their cell count grows with the scale). Generation is deterministic
+for a given day, scale and seed.
+
+Some solvers hard-code properties of the real puzzle, which limits what can
+be scaled for those days:
+- Day 14 uses a fixed 101x103 room, so only the robot count grows (capped to
+  fit distinct positions for the tree pattern).
+- Day 17 runs a fixed-shape program; the generator varies its constants.
+- Day 24 wire names must be three characters, so the adder has at most 99 bits.
+- Day 25 schematics are always 7x5; only their number grows.
+
+Usage: python -m aoc.generators DAY [--scale 10] [--seed 0] [-o 09/input_x10.txt]
+"""
+import argparse
+import math
+import os
+import random
+import string
+import sys
+
+from aoc.runner import ROOT, load_module
+
+
+def scaled_side(base, scale):
+    """
+    Side length of a square grid holding `scale` times as many cells as a base x base grid.
+    """
+    return max(base, round(base * math.sqrt(scale)))
+
+
+def scaled_count(base, scale):
+    return max(1, round(base * scale))
+
+
+def format_grid(grid):
+    return '\n'.join(''.join(row) for row in grid) + '\n'
+
+
+def generate_day01(rng, scale):
+    rows = scaled_count(1000, scale)
+    left = [rng.randint(10000, 99999) for _ in range(rows)]
+    # Draw part of the right list from the left one so the similarity score is not zero
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999) for _ in range(rows)]
+    return ''.join(f"{l}   {r}\n" for l, r in zip(left, right))
+
+
+def generate_day02(rng, scale):
+    lines = []
+    for _ in range(scaled_count(1000, scale)):
+        length = rng.randint(5, 8)
+        sign = rng.choice((-1, 1))
+        report = [rng.randint(20, 70)]
+        for _ in range(length - 1):
+            report.append(report[-1] + sign * rng.randint(1, 3))
+        kind = rng.random()
+        if kind < 0.3:
+            # One bad level, which the Problem Dampener can remove
+            report[rng.randrange(length)] += rng.choice((-4, 0, 5))
+        elif kind < 0.6:
+            report = [rng.randint(1, 99) for _ in range(length)]
+        lines.append(' '.join(map(str, report)))
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day03(rng, scale):
+    noise = "mul()don't,0123456789[]{}<>!@#$%^&*?:;+-~' whywhenselectfromwhohow"
+    tokens = []
+    length = 0
+    target = scaled_count(18000, scale)
+    while length < target:
+        choice = rng.random()
+        if choice < 0.1:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif choice < 0.12:
+            token = "do()"
+        elif choice < 0.14:
+            token = "don't()"
+        else:
+            token = ''.join(rng.choice(noise) for _ in range(rng.randint(1, 8)))
+        tokens.append(token)
+        length += len(token)
+    return ''.join(tokens) + '\n'
+
+
+def generate_day04(rng, scale):
+    side = scaled_side(140, scale)
+    return format_grid([[rng.choice("XMAS") for _ in range(side)] for _ in range(side)])
+
+
+def generate_day05(rng, scale):
+    page_count = max(25, round(49 * math.sqrt(scale)))
+    pages = rng.sample(range(10, 10 + page_count * 10), page_count)
+    # A total order of all pages, so every update has exactly one correct ordering
+    rules = [(pages[i], pages[j]) for i in range(page_count) for j in range(i + 1, page_count)]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(scaled_count(192, scale)):
+        length = rng.randrange(5, min(23, page_count) + 1, 2)
+        update = rng.sample(pages, length)
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(update)
+
+    return (
+        ''.join(f"{before}|{after}\n" for before, after in rules)
+        + '\n'
+        + ''.join(','.join(map(str, update)) + '\n' for update in updates)
+    )
+
+
+def generate_day06(rng, scale):
+    side = scaled_side(130, scale)
+    grid = [['.'] * side for _ in range(side)]
+    start = row, col = (side // 2 + rng.randint(-side // 8, side // 8),
+                        side // 2 + rng.randint(-side // 8, side // 8))
+    visited = {start}
+
+    # Walk an outward spiral, ending every leg at a new obstacle. Each leg is
+    # longer than the previous one, so legs never overlap and the patrol is
+    # loop-free (the part 1 and part 2 solvers reject a looping patrol with a
+    # ValueError) and eventually leaves the map.
+    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+    length = 0
+    leg = 0
+    while True:
+        dr, dc = directions[leg % 4]
+        length += rng.randint(1, 2)
+        for _ in range(length):
+            row, col = row + dr, col + dc
+            if not (0 <= row < side and 0 <= col < side):
+                break
+            visited.add((row, col))
+        else:
+            obstacle_row, obstacle_col = row + dr, col + dc
+            if 0 <= obstacle_row < side and 0 <= obstacle_col < side:
+                grid[obstacle_row][obstacle_col] = '#'
+                leg += 1
+                continue
+        break
+
+    # Obstacles away from the route do not change the patrol, but give part 2 more to work with
+    for _ in range(side * side // 25):
+        r, c = rng.randrange(side), rng.randrange(side)
+        if (r, c) not in visited:
+            grid[r][c] = '#'
+    grid[start[0]][start[1]] = '^'
+    return format_grid(grid)
+
+
+def generate_day07(rng, scale):
+    lines = []
+    for _ in range(scaled_count(850, scale)):
+        numbers = [rng.randint(1, 999) if rng.random() < 0.2 else rng.randint(1, 9)
+                   for _ in range(rng.randint(3, 12))]
+        if rng.random() < 0.5:
+            target = numbers[0]
+            for number in numbers[1:]:
+                op = rng.choice('+*|')
+                if op == '+':
+                    target += number
+                elif op == '*':
+                    target *= number
+                else:
+                    target = int(f"{target}{number}")
+        else:
+            target = rng.randint(1, 10 ** rng.randint(3, 14))
+        lines.append(f"{target}: {' '.join(map(str, numbers))}")
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day08(rng, scale):
+    side = scaled_side(50, scale)
+    frequencies = string.digits + string.ascii_letters
+    grid = [['.'] * side for _ in range(side)]
+    for _ in range(scaled_count(200, scale)):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+    return format_grid(grid)
+
+
+def generate_day09(rng, scale):
+    length = scaled_count(20000, scale) | 1  # Odd, so the map ends with a file
+    digits = [str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(length)]
+    return ''.join(digits) + '\n'
+
+
+def generate_day10(rng, scale):
+    side = scaled_side(60, scale)
+    grid = [[str(rng.randint(0, 9)) for _ in range(side)] for _ in range(side)]
+    # Lay down random self-avoiding ascending walks so there are trails from 0 to 9
+    for _ in range(scaled_count(250, scale)):
+        row, col = rng.randrange(side), rng.randrange(side)
+        walk = set()
+        for height in range(10):
+            grid[row][col] = str(height)
+            walk.add((row, col))
+            options = [
+                (row + dr, col + dc) for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= row + dr < side and 0 <= col + dc < side and (row + dr, col + dc) not in walk
+            ]
+            if not options:
+                break
+            row, col = rng.choice(options)
+    return format_grid(grid)
+
+
+def generate_day11(rng, scale):
+    stones = [rng.randint(0, 10 ** rng.randint(1, 7)) for _ in range(scaled_count(8, scale))]
+    return ' '.join(map(str, stones)) + '\n'
+
+
+def generate_day12(rng, scale):
+    side = scaled_side(140, scale)
+    grid = [[None] * side for _ in range(side)]
+    # Grow regions from random seeds in a random order
+    frontier = []
+    for _ in range(scaled_count(600, scale)):
+        row, col = rng.randrange(side), rng.randrange(side)
+        if grid[row][col] is None:
+            grid[row][col] = rng.choice(string.ascii_uppercase)
+            frontier.append((row, col))
+    while frontier:
+        index = rng.randrange(len(frontier))
+        frontier[index], frontier[-1] = frontier[-1], frontier[index]
+        row, col = frontier.pop()
+        for nr, nc in ((row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)):
+            if 0 <= nr < side and 0 <= nc < side and grid[nr][nc] is None:
+                grid[nr][nc] = grid[row][col]
+                frontier.append((nr, nc))
+    return format_grid(grid)
+
+
+PART2_OFFSET = 10000000000000  # Added to every prize coordinate in day 13 part 2
+
+
+def winnable_offset(ax, ay, bx, by):
+    """
+    Whether whole button presses make up the part 2 offset on both axes;
+    only then could a prize of part 2 also be won in part 1.
+    """
+    det = ax * by - ay * bx
+    return (PART2_OFFSET * (by - bx)) % det == 0 and (PART2_OFFSET * (ax - ay)) % det == 0
+
+
+def generate_day13(rng, scale):
+    machines = []
+    for _ in range(scaled_count(320, scale)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        kind = rng.random()
+        if kind < 0.4:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        elif kind < 0.7 and ax * by != ay * bx and not winnable_offset(ax, ay, bx, by):
+            # Only winnable in part 2, once its offset is added back to the prize
+            a, b = rng.randint(5 * 10**11 + 1, 10**12), rng.randint(5 * 10**11 + 1, 10**12)
+            px, py = a * ax + b * bx - PART2_OFFSET, a * ay + b * by - PART2_OFFSET
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n")
+    return '\n'.join(machines)
+
+
+def generate_day14(rng, scale):
+    width, height = 101, 103
+    count = min(scaled_count(500, scale), width * height // 2)
+    # Place the robots on distinct tiles at some second and run them backwards,
+    # so the tree pattern search of part 2 terminates
+    tree_second = rng.randrange(1, width * height)
+    positions = rng.sample(range(width * height), count)
+    lines = []
+    for position in positions:
+        x, y = position % width, position // width
+        vx, vy = rng.randint(-99, 99), rng.randint(-99, 99)
+        lines.append(f"p={(x - vx * tree_second) % width},{(y - vy * tree_second) % height} v={vx},{vy}")
+    return '\n'.join(lines) + '\n'
+
+
+def generate_day15(rng, scale):
+    side = scaled_side(50, scale)
+    grid = [['#'] * side]
+    for _ in range(side - 2):
+        row = ['#']
+        for _ in range(side - 2):
+            cell = rng.random()
+            row.append('#' if cell < 0.05 else 'O' if cell < 0.4 else '.')
+        grid.append(row + ['#'])
+    grid.append(['#'] * side)
+    grid[rng.randrange(1, side - 1)][rng.randrange(1, side - 1)] = '@'
+
+    moves = ''.join(rng.choice('<>^v') for _ in range(scaled_count(20000, scale)))
+    move_lines = [moves[i:i + 1000] for i in range(0, len(moves), 1000)]
+    return format_grid(grid) + '\n' + '\n'.join(move_lines) + '\n'
+
+
+def carve_maze(rng, side):
+    """
+    Carve a perfect maze into an odd-sized grid of walls with an iterative DFS.
+    Open cells have odd coordinates.
+    """
+    grid = [['#'] * side for _ in range(side)]
+    stack = [(side - 2, 1)]
+    grid[side - 2][1] = '.'
+    while stack:
+        row, col = stack[-1]
+        options = [
+            (row + dr, col + dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + dr < side - 1 and 0 < col + dc < side - 1 and grid[row + dr][col + dc] == '#'
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = rng.choice(options)
+        grid[(row + nr) // 2][(col + nc) // 2] = '.'
+        grid[nr][nc] = '.'
+        stack.append((nr, nc))
+    return grid
+
+
+def generate_day16(rng, scale):
+    side = scaled_side(141, scale) | 1
+    grid = carve_maze(rng, side)
+    # Knock out some walls so there are several best paths
+    for _ in range(side * side // 50):
+        row, col = rng.randrange(1, side - 1), rng.randrange(1, side - 1)
+        if (row + col) % 2 == 1:
+            grid[row][col] = '.'
+    grid[side - 2][1] = 'S'
+    grid[1][side - 2] = 'E'
+    return format_grid(grid)
+
+
+def generate_day17(rng, scale):
+    computer = load_module(os.path.join(ROOT, '17', 'chronospatial_computer.py'))
+    # Same shape as the real program: b = a % 8, two xors with constants and c = a >> b
+    while True:
+        k1, k2 = rng.randrange(8), rng.randrange(8)
+        program = [2, 4, 1, k1, 7, 5, 1, k2, 4, rng.randrange(8), 5, 5, 0, 3, 3, 0]
+        try:
+            computer.find_alternative_A(program)
+        except IndexError:
+            continue  # No register value reproduces this program
+        a = rng.randrange(8 ** 7, 8 ** 9)
+        return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: {','.join(map(str, program))}\n"
+
+
+def generate_day18(rng, scale):
+    side = scaled_side(71, scale)
+    # Keep a random staircase from the top-left to the bottom-right corner free
+    # until the end, so the exit stays reachable for most of the falling bytes
+    path = [(0, 0)]
+    while path[-1] != (side - 1, side - 1):
+        x, y = path[-1]
+        if y == side - 1 or (x < side - 1 and rng.random() < 0.5):
+            path.append((x + 1, y))
+        else:
+            path.append((x, y + 1))
+    on_path = set(path)
+    others = [(x, y) for x in range(side) for y in range(side) if (x, y) not in on_path]
+
+    count = round(side * side * 0.68)
+    tail = rng.sample(path[1:-1], 10)
+    cells = rng.sample(others, count - len(tail)) + tail
+    return ''.join(f"{x},{y}\n" for x, y in cells)
+
+
+def generate_day19(rng, scale):
+    colors = 'wubrg'
+    patterns = {''.join(rng.choice(colors) for _ in range(rng.randint(1, 8))) for _ in range(450)}
+    # Like the real puzzle, leave out one single color so some designs are impossible
+    patterns.discard(rng.choice(colors))
+    patterns = sorted(patterns, key=lambda _: rng.random())
+
+    designs = []
+    for _ in range(scaled_count(400, scale)):
+        if rng.random() < 0.7:
+            design = ''
+            length = rng.randint(20, 60)
+            while len(design) < length:
+                design += rng.choice(patterns)
+        else:
+            design = ''.join(rng.choice(colors) for _ in range(rng.randint(20, 60)))
+        designs.append(design)
+    return ', '.join(patterns) + '\n\n' + '\n'.join(designs) + '\n'
+
+
+def generate_day20(rng, scale):
+    side = scaled_side(141, scale) | 1
+    maze = carve_maze(rng, side)
+    start, end = (side - 2, 1), (1, side - 2)
+
+    # The race track is the single path between start and end through the maze
+    parents = {start: None}
+    stack = [start]
+    while stack:
+        row, col = stack.pop()
+        for nr, nc in ((row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)):
+            if maze[nr][nc] == '.' and (nr, nc) not in parents:
+                parents[(nr, nc)] = (row, col)
+                stack.append((nr, nc))
+
+    grid = [['#'] * side for _ in range(side)]
+    cell = end
+    while cell is not None:
+        grid[cell[0]][cell[1]] = '.'
+        cell = parents[cell]
+    grid[start[0]][start[1]] = 'S'
+    grid[end[0]][end[1]] = 'E'
+    return format_grid(grid)
+
+
+def generate_day21(rng, scale):
+    codes = [f"{rng.randint(1, 999):03}A" for _ in range(scaled_count(5, scale))]
+    return '\n'.join(codes) + '\n'
+
+
+def generate_day22(rng, scale):
+    secrets = [rng.randint(1, 16777215) for _ in range(scaled_count(2400, scale))]
+    return '\n'.join(map(str, secrets)) + '\n'
+
+
+def generate_day23(rng, scale):
+    node_count = scaled_count(520, scale)
+    name_length = 2 if node_count <= 26 ** 2 else 3
+    names = set()
+    while len(names) < node_count:
+        names.add(''.join(rng.choice(string.ascii_lowercase) for _ in range(name_length)))
+    names = sorted(names)
+
+    edges = set()
+    for name in names:
+        for other in rng.sample(names, 6):
+            if other != name:
+                edges.add(tuple(sorted((name, other))))
+    # Plant one large clique for part 2
+    clique = rng.sample(names, 13)
+    for i, a in enumerate(clique):
+        for b in clique[i + 1:]:
+            edges.add(tuple(sorted((a, b))))
+
+    edges = sorted(edges)
+    rng.shuffle(edges)
+    return ''.join(f"{a}-{b}\n" for a, b in edges)
+
+
+def generate_day24(rng, scale):
+    bits = max(16, min(scaled_count(45, scale), 99))
+    names = set()
+    while len(names) < bits * 5:
+        name = ''.join(rng.choice(string.ascii_lowercase) for _ in range(3))
+        if name[0] not in 'xyz':
+            names.add(name)
+    names = iter(sorted(names, key=lambda _: rng.random()))
+
+    # Ripple-carry adder; each entry is [input, op, input, output]
+    gates = [['x00', 'XOR', 'y00', 'z00'], ['x00', 'AND', 'y00', next(names)]]
+    carry = gates[-1][3]
+    per_bit = {}
+    for i in range(1, bits):
+        x, y, z = f"x{i:02}", f"y{i:02}", f"z{i:02}"
+        half_sum = [x, 'XOR', y, next(names)]
+        total = [half_sum[3], 'XOR', carry, z]
+        half_carry = [x, 'AND', y, next(names)]
+        carry_and = [half_sum[3], 'AND', carry, next(names)]
+        carry_out = [half_carry[3], 'OR', carry_and[3], f"z{bits:02}" if i == bits - 1 else next(names)]
+        gates.extend([half_sum, total, half_carry, carry_and, carry_out])
+        per_bit[i] = (half_sum, total, half_carry, carry_and, carry_out)
+        carry = carry_out[3]
+
+    # Swap the outputs of four gate pairs at well separated bits, using the
+    # kinds of swaps the part 2 solver repairs
+    for i in rng.sample(range(2, bits - 2, 3), 4):
+        half_sum, total, half_carry, carry_and, carry_out = per_bit[i]
+        first, second = rng.choice([(half_sum, half_carry), (total, half_carry),
+                                    (total, carry_and), (total, carry_out)])
+        first[3], second[3] = second[3], first[3]
+
+    rng.shuffle(gates)
+    wires = [f"{axis}{i:02}: {rng.randint(0, 1)}" for axis in 'xy' for i in range(bits)]
+    return '\n'.join(wires) + '\n\n' + ''.join(f"{a} {op} {b} -> {out}\n" for a, op, b, out in gates)
+
+
+def generate_day25(rng, scale):
+    schematics = []
+    for _ in range(scaled_count(500, scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        rows = [''.join('#' if height >= level else '.' for height in heights) for level in range(1, 6)]
+        if rng.random() < 0.5:
+            schematics.append('\n'.join(['#####'] + rows + ['.....']))
+        else:
+            schematics.append('\n'.join(['.....'] + rows[::-1] + ['#####']))
+    return '\n\n'.join(schematics) + '\n'
+
+
+GENERATORS = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    16: generate_day16,
+    17: generate_day17,
+    18: generate_day18,
+    19: generate_day19,
+    20: generate_day20,
+    21: generate_day21,
+    22: generate_day22,
+    23: generate_day23,
+    24: generate_day24,
+    25: generate_day25,
+}
+
+
+def generate(day, scale=1, seed=0):
+    """
+    Generate the input for a day at the given scale.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"No generator for day {day}")
+    return GENERATORS[day](random.Random(f"{day}:{scale}:{seed}"), scale)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Advent of Code 2024 inputs.")
+    parser.add_argument('day', type=int, help="Day to generate the input for.")
+    parser.add_argument('--scale', type=float, default=1, help="Size relative to the real puzzle input.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the random generator.")
+    parser.add_argument('-o', '--output', help="Write to this file instead of stdout.")
+    args = parser.parse_args()
+
+    data = generate(args.day, args.scale, args.seed)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(data)
+    else:
+        sys.stdout.write(data)
+
+
+if __name__ == "__main__":
+    main()
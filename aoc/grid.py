@@ -0,0 +1,105 @@
+"""
+Compact character grid shared by the grid-based days.
+
+The grid is stored row by row in a single flat bytearray (one byte per cell)
+and surrounded by `padding` cells of the OUTSIDE sentinel on every side. Cells
+are addressed by integer index, neighbors are reached by adding precomputed
+offsets, and walking off the map lands on a sentinel cell instead of needing a
+bounds check.
+"""
+OUTSIDE = 0  # Sentinel byte of the padding; never occurs in puzzle inputs
+
+
+class Grid:
+    def __init__(self, rows, cols, fill='.', padding=1):
+        self.rows = rows
+        self.cols = cols
+        self.padding = padding
+        self.width = cols + 2 * padding
+        self.cells = bytearray(self.width * (rows + 2 * padding))
+        for row in range(rows):
+            start = self.index(row, 0)
+            self.cells[start:start + cols] = fill.encode() * cols
+        self._init_offsets()
+
+    def _init_offsets(self):
+        w = self.width
+        # Clockwise, starting upwards: up, right, down, left
+        self.directions = (-w, 1, w, -1)
+        self.diagonals = (-w - 1, -w + 1, w - 1, w + 1)
+
+    @classmethod
+    def from_buffer(cls, cells, rows, cols, padding=1):
+        """
+        Wrap existing cell memory laid out like `Grid.cells` (e.g. a shared
+        memory buffer) without copying it.
+        """
+        grid = cls.__new__(cls)
+        grid.rows = rows
+        grid.cols = cols
+        grid.padding = padding
+        grid.width = cols + 2 * padding
+        grid.cells = cells
+        grid._init_offsets()
+        return grid
+
+    @classmethod
+    def from_lines(cls, lines, padding=1):
+        """
+        Build a grid from a list of equally long strings.
+        """
+        grid = cls(len(lines), len(lines[0]) if lines else 0, padding=padding)
+        for row, line in enumerate(lines):
+            start = grid.index(row, 0)
+            grid.cells[start:start + grid.cols] = line.encode()
+        return grid
+
+    @classmethod
+    def from_file(cls, file_path, padding=1):
+        """
+        Read a grid from a file, ignoring empty lines.
+        """
+        with open(file_path, 'r') as file:
+            return cls.from_lines([line.strip() for line in file if line.strip()], padding)
+
+    def index(self, row, col):
+        return (row + self.padding) * self.width + col + self.padding
+
+    def position(self, index):
+        row, col = divmod(index, self.width)
+        return row - self.padding, col - self.padding
+
+    def indices(self):
+        """
+        Iterate over the indices of all cells inside the grid, row by row.
+        """
+        for row in range(self.rows):
+            start = self.index(row, 0)
+            yield from range(start, start + self.cols)
+
+    def find(self, char):
+        """
+        Return the index of the first cell holding `char`, or None.
+        """
+        index = self.cells.find(char.encode())
+        return index if index >= 0 else None
+
+    def count(self, char):
+        return self.cells.count(char.encode())
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def __getitem__(self, index):
+        return chr(self.cells[index])
+
+    def __setitem__(self, index, char):
+        self.cells[index] = ord(char)
+
+    def __str__(self):
+        return '\n'.join(
+            self.cells[self.index(row, 0):self.index(row, self.cols)].decode() for row in range(self.rows)
+        )
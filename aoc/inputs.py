@@ -0,0 +1,76 @@
+"""
+Shared input loading: memory-mapped input files and an on-disk cache of
+parsed inputs.
+
+`map_input` exposes the raw bytes of an input file through a memoryview of a
+read-only memory map, so hashing and scanning the file never copies it.
+`load_cached` stores the result of a parser as a pickle named after a caller
+supplied key and the SHA-256 of the input file; as long as neither changes,
+later runs load the pickle instead of parsing again.
+"""
+import contextlib
+import hashlib
+import mmap
+import os
+import pickle
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(ROOT, '.cache', 'parsed')
+
+
+@contextlib.contextmanager
+def map_input(file_path):
+    """
+    Memory-map a file read-only and yield its contents as a memoryview.
+    Slices of the view do not copy, but must not be kept after the block
+    ends. Empty files cannot be mapped and yield an empty view instead.
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield memoryview(b'')
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                yield view
+
+
+def file_digest(file_path):
+    """
+    Return the SHA-256 hex digest of a file's contents.
+    """
+    with map_input(file_path) as data:
+        return hashlib.sha256(data).hexdigest()
+
+
+def cache_path(key, file_path, cache_dir=DEFAULT_CACHE_DIR):
+    return os.path.join(cache_dir, f"{key}-{file_digest(file_path)}.pickle")
+
+
+def load_cached(key, file_path, parse, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Return `parse(file_path)`, loading it from the cache when possible.
+
+    The key must identify the parser (e.g. day, part and a digest of the
+    solution script), since the cache only checks the input file itself.
+    Results that cannot be pickled are returned without being cached.
+    """
+    path = cache_path(key, file_path, cache_dir)
+    try:
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass
+
+    parsed = parse(file_path)
+    try:
+        data = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return parsed
+
+    # Write to a temporary file first so that parallel workers never read a partial pickle
+    os.makedirs(cache_dir, exist_ok=True)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, 'wb') as file:
+        file.write(data)
+    os.replace(temporary_path, path)
+    return parsed
@@ -0,0 +1,137 @@
+"""
+Opt-in instrumentation of the known hot functions of the daily solutions.
+
+When profiling is enabled (`python -m aoc.runner --profile FILE`, or the
+AOC_PROFILE environment variable set to the output file), the runner replaces
+the hot functions of every script it loads with timing wrappers before the
+solution runs. It records call counts and cumulative time per function and
+writes the self time of every call stack as a collapsed-stack file, one line
+per stack (`day06.2;solve;guard_patrol_part2.simulate_with_obstacle 123`,
+weights in microseconds), ready for flamegraph.pl or speedscope.
+
+When profiling is disabled nothing is wrapped, so the solutions run exactly
+as they would without this module.
+"""
+import contextlib
+import functools
+import os
+import time
+from collections import defaultdict
+
+ENV_VAR = 'AOC_PROFILE'
+
+HOT_FUNCTIONS = (
+    'simulate_with_obstacle',
+    'find_free_space_spans',
+    'transform_stone',
+    'bfs_shortest_path',
+    'next_secret',
+    'run_program',
+    'solve',
+)
+
+
+class Profiler:
+    def __init__(self):
+        self.calls = defaultdict(int)
+        self.cumulative = defaultdict(float)
+        self.stacks = defaultdict(float)  # collapsed stack -> self time in seconds
+        self._frames = []  # active frames as [name, start, time spent in children]
+        self._depth = defaultdict(int)  # active calls per function, for recursion
+
+    def enter(self, name):
+        self._frames.append([name, time.perf_counter(), 0.0])
+
+    def leave(self):
+        """
+        Close the innermost frame, charging its self time to its call stack.
+        Returns the total time spent in the frame.
+        """
+        name, start, children = self._frames.pop()
+        elapsed = time.perf_counter() - start
+        stack = ';'.join([frame[0] for frame in self._frames] + [name])
+        self.stacks[stack] += elapsed - children
+        if self._frames:
+            self._frames[-1][2] += elapsed
+        return elapsed
+
+    @contextlib.contextmanager
+    def frame(self, name):
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.leave()
+
+    def wrap(self, function, label):
+        """
+        Return a wrapper recording calls of `function` under `label`.
+        Cumulative time counts only the outermost call of recursive functions.
+        """
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.calls[label] += 1
+            self._depth[label] += 1
+            self.enter(label)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = self.leave()
+                self._depth[label] -= 1
+                if not self._depth[label]:
+                    self.cumulative[label] += elapsed
+
+        wrapper.__profiled__ = function
+        return wrapper
+
+    def snapshot(self):
+        """
+        Return the recorded data as plain dictionaries, e.g. to send it to another process.
+        """
+        return dict(self.calls), dict(self.cumulative), dict(self.stacks)
+
+    def merge(self, snapshot):
+        calls, cumulative, stacks = snapshot
+        for label, count in calls.items():
+            self.calls[label] += count
+        for label, seconds in cumulative.items():
+            self.cumulative[label] += seconds
+        for stack, seconds in stacks.items():
+            self.stacks[stack] += seconds
+
+    def write_collapsed(self, path):
+        """
+        Write the collapsed stacks with their self time in whole microseconds.
+        """
+        with open(path, 'w') as file:
+            for stack, seconds in sorted(self.stacks.items()):
+                microseconds = round(seconds * 1e6)
+                if microseconds > 0:
+                    file.write(f"{stack} {microseconds}\n")
+
+    def format_stats(self):
+        lines = [f"{'calls':>12} {'cumulative':>12}  function"]
+        for label in sorted(self.calls, key=lambda label: -self.cumulative[label]):
+            lines.append(f"{self.calls[label]:>12} {self.cumulative[label]:>11.4f}s  {label}")
+        return '\n'.join(lines)
+
+
+def instrument(module, profiler):
+    """
+    Replace the hot functions defined in a solution module with wrappers
+    reporting to `profiler`. Functions wrapped for an earlier profiler are
+    unwrapped first, so a cached module can be instrumented again.
+    """
+    stem = module.__name__.split('_', 1)[-1]
+    for name in HOT_FUNCTIONS:
+        function = getattr(module, name, None)
+        function = getattr(function, '__profiled__', function)
+        if callable(function) and getattr(function, '__module__', None) == module.__name__:
+            setattr(module, name, profiler.wrap(function, f"{stem}.{name}"))
+
+
+def profile_path_from_env():
+    """
+    Return the output file requested through the AOC_PROFILE environment variable, or None.
+    """
+    return os.environ.get(ENV_VAR) or None
@@ -0,0 +1,263 @@
+"""
+Run all daily solutions inside a single interpreter.
+
+Usage: python -m aoc.runner [--days 1 6 ...] [--input input.txt] [--json]
+                            [--workers N] [--baseline FILE]
+                            [--cache-dir DIR | --no-cache] [--profile FILE]
+
+Parsed inputs are cached on disk (see aoc.inputs), so repeated runs skip
+parsing unless the input file or the day's script changed. With `--profile`
+the hot functions are instrumented (see aoc.profiling).
+"""
+import argparse
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, NamedTuple, Optional
+
+from aoc.inputs import DEFAULT_CACHE_DIR, file_digest, load_cached
+from aoc.profiling import Profiler, instrument, profile_path_from_env
+from aoc.solutions import SOLUTIONS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Result(NamedTuple):
+    day: int
+    part: int
+    module: str
+    answer: Any
+    seconds: float
+    error: Optional[str] = None
+
+
+def discover_modules(root=ROOT):
+    """
+    Find every solution script in the day folders.
+    Returns a dictionary mapping (day, module name) to the script path.
+    """
+    modules = {}
+    for path in sorted(glob.glob(os.path.join(root, '[0-9][0-9]', '*.py'))):
+        day = int(os.path.basename(os.path.dirname(path)))
+        name = os.path.splitext(os.path.basename(path))[0]
+        modules[(day, name)] = path
+    return modules
+
+
+_loaded_modules = {}
+
+
+def load_module(path):
+    """
+    Import a solution script by its file path. Modules are cached so that
+    solutions sharing a script (e.g. both parts of day 16) load it once.
+    """
+    if path not in _loaded_modules:
+        day = os.path.basename(os.path.dirname(path))
+        name = os.path.splitext(os.path.basename(path))[0]
+        spec = importlib.util.spec_from_file_location(f"day{day}_{name}", path)
+        module = importlib.util.module_from_spec(spec)
+        # Registered like a regular import, so that functions of the script can
+        # be pickled by reference (e.g. for the script's own process pools)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _loaded_modules[path] = module
+    return _loaded_modules[path]
+
+
+def module_path(solution, root=ROOT):
+    return os.path.join(root, f"{solution.day:02}", f"{solution.module}.py")
+
+
+def input_path(solution, input_name='input.txt', root=ROOT):
+    return os.path.join(root, f"{solution.day:02}", input_name)
+
+
+def select_solutions(days=None, root=ROOT):
+    """
+    Return the registered solutions whose script exists, optionally limited to some days.
+    """
+    modules = discover_modules(root)
+    return [
+        solution for solution in SOLUTIONS
+        if (solution.day, solution.module) in modules and (not days or solution.day in days)
+    ]
+
+
+# Shared code that shapes every parsed input: the parse adapters, the grid
+# layout and the input readers
+PARSER_SOURCES = tuple(
+    os.path.join(ROOT, 'aoc', name) for name in ('solutions.py', 'grid.py', 'inputs.py')
+)
+
+
+def parser_digest(module):
+    """
+    Return a digest of the day's script together with the shared parser code.
+    """
+    digests = [file_digest(path) for path in (module.__file__,) + PARSER_SOURCES]
+    return hashlib.sha256(''.join(digests).encode()).hexdigest()
+
+
+def parse_input(solution, module, file_path, cache_dir=None):
+    """
+    Run the solution's parse stage, going through the parsed-input cache
+    when a cache directory is given. The cache key includes a digest of the
+    day's script and of the shared parser code (see PARSER_SOURCES), so that
+    editing a parser, a parse adapter or the grid invalidates cached results.
+    """
+    if cache_dir is None:
+        return solution.parse(module, file_path)
+    key = f"{solution.day:02}.{solution.part}-{parser_digest(module)[:16]}"
+    return load_cached(key, file_path, lambda path: solution.parse(module, path), cache_dir)
+
+
+def run_solution(solution, input_name='input.txt', root=ROOT, cache_dir=None, profiler=None):
+    """
+    Parse the day's input and solve one part, capturing errors in the result.
+    With a profiler, the module's hot functions are instrumented and both
+    stages are recorded below a `dayDD.P` frame.
+    """
+    start = time.perf_counter()
+    try:
+        module = load_module(module_path(solution, root))
+        file_path = input_path(solution, input_name, root)
+        if profiler is None:
+            parsed = parse_input(solution, module, file_path, cache_dir)
+            answer = solution.solve(module, parsed)
+        else:
+            instrument(module, profiler)
+            with profiler.frame(f"day{solution.day:02}.{solution.part}"):
+                with profiler.frame('parse'):
+                    parsed = parse_input(solution, module, file_path, cache_dir)
+                with profiler.frame('solve'):
+                    answer = solution.solve(module, parsed)
+    except Exception as e:
+        return Result(solution.day, solution.part, solution.module, None,
+                      time.perf_counter() - start, f"{type(e).__name__}: {e}")
+    return Result(solution.day, solution.part, solution.module, answer,
+                  time.perf_counter() - start)
+
+
+def run_all(days=None, input_name='input.txt', root=ROOT, cache_dir=None, profiler=None):
+    """
+    Run every selected solution serially and return the list of results.
+    """
+    return [
+        run_solution(solution, input_name, root, cache_dir, profiler)
+        for solution in select_solutions(days, root)
+    ]
+
+
+def load_costs(baseline_path):
+    """
+    Read the historical cost (parse + solve seconds) of every day/part from a
+    benchmark baseline. Returns an empty dictionary if there is no baseline.
+    """
+    if not baseline_path or not os.path.exists(baseline_path):
+        return {}
+    with open(baseline_path, 'r') as file:
+        baseline = json.load(file)
+    costs = {}
+    for key, timing in baseline.items():
+        day, part = map(int, key.split('.'))
+        costs[(day, part)] = timing['parse'] + timing['solve']
+    return costs
+
+
+def schedule(solutions, costs):
+    """
+    Order the solutions longest-processing-time-first.
+    Solutions without a recorded cost go first, as they may well be the slowest.
+    """
+    return sorted(solutions, key=lambda s: -costs.get((s.day, s.part), float('inf')))
+
+
+def _run_in_worker(day, part, input_name, root, cache_dir, profile):
+    # Solutions hold lambdas, which cannot be pickled, so workers look them up by key
+    solution = next(s for s in SOLUTIONS if (s.day, s.part) == (day, part))
+    if not profile:
+        return run_solution(solution, input_name, root, cache_dir), None
+    # Each job gets its own profiler; the parent merges the recorded data
+    profiler = Profiler()
+    return run_solution(solution, input_name, root, cache_dir, profiler), profiler.snapshot()
+
+
+def run_parallel(days=None, input_name='input.txt', root=ROOT, workers=None, baseline_path=None,
+                 cache_dir=None, profiler=None):
+    """
+    Run the selected solutions in a process pool and yield results as they complete.
+    Jobs are queued slowest first according to the benchmark baseline; each idle
+    worker takes the next queued job, so short jobs fill in around the long ones.
+    """
+    solutions = schedule(select_solutions(days, root), load_costs(baseline_path))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_in_worker, solution.day, solution.part, input_name, root, cache_dir,
+                            profiler is not None)
+            for solution in solutions
+        ]
+        for future in as_completed(futures):
+            result, snapshot = future.result()
+            if snapshot is not None:
+                profiler.merge(snapshot)
+            yield result
+
+
+def format_result(result):
+    answer = result.answer if result.error is None else f"ERROR ({result.error})"
+    return f"Day {result.day:02} part {result.part} ({result.module}): {answer}  [{result.seconds:.3f}s]"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Advent of Code 2024 solutions in-process.")
+    parser.add_argument('--days', type=int, nargs='+', help="Only run these days.")
+    parser.add_argument('--input', default='input.txt', help="Input file name inside each day folder.")
+    parser.add_argument('--json', action='store_true', help="Print the results as JSON.")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of worker processes; 0 uses one per CPU.")
+    parser.add_argument('--baseline', default=os.path.join(ROOT, 'benchmark_baseline.json'),
+                        help="Benchmark baseline used to start the slowest days first.")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Directory of the parsed-input cache.")
+    parser.add_argument('--no-cache', action='store_true', help="Always parse the inputs.")
+    parser.add_argument('--profile', default=profile_path_from_env(), metavar='FILE',
+                        help="Instrument the hot functions and write collapsed stacks to FILE "
+                             "(default: $AOC_PROFILE).")
+    args = parser.parse_args()
+    cache_dir = None if args.no_cache else args.cache_dir
+    profiler = Profiler() if args.profile else None
+
+    if args.workers == 1:
+        results = run_all(args.days, args.input, cache_dir=cache_dir, profiler=profiler)
+        if not args.json:
+            for result in results:
+                print(format_result(result))
+    else:
+        results = []
+        for result in run_parallel(args.days, args.input, workers=args.workers or None,
+                                   baseline_path=args.baseline, cache_dir=cache_dir, profiler=profiler):
+            results.append(result)
+            if not args.json:
+                print(format_result(result), flush=True)
+        results.sort(key=lambda result: (result.day, result.part))
+
+    if args.json:
+        print(json.dumps([result._asdict() for result in results], indent=2))
+
+    if profiler is not None:
+        profiler.write_collapsed(args.profile)
+        # Keep stdout clean for --json
+        print(profiler.format_stats(), file=sys.stderr)
+        print(f"Collapsed stacks written to {args.profile}", file=sys.stderr)
+
+    if any(result.error for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Registry describing how to drive every day's solution without its `main()`.
+
+Each entry names the script inside the day folder, a `parse` callable that
+turns the input file into the solver's input and a `solve` callable that
+computes the answer. Both receive the loaded script module as their first
+argument, so the actual work always happens in the day's own functions; the
+callables here only mirror the glue code of the corresponding `main()`.
+"""
+import re
+from typing import Callable, NamedTuple
+
+from aoc.grid import Grid
+from aoc.inputs import map_input
+
+
+class Solution(NamedTuple):
+    day: int
+    part: int
+    module: str
+    parse: Callable
+    solve: Callable
+
+
+def read_text(module, file_path):
+    """
+    Read the whole input file as a single string.
+    """
+    with map_input(file_path) as data:
+        return str(data, 'utf-8')
+
+
+def read_lines(module, file_path):
+    """
+    Read the non-empty, stripped lines of the input file.
+    """
+    return [line.strip() for line in read_text(module, file_path).splitlines() if line.strip()]
+
+
+def read_grid(module, file_path):
+    """
+    Read the input file as a padded Grid.
+    """
+    return Grid.from_file(file_path)
+
+
+def read_ints(module, file_path):
+    """
+    Read all whitespace-separated integers of the input file.
+    The tokens are matched directly on the mapped bytes, without decoding the file.
+    """
+    with map_input(file_path) as data:
+        return list(map(int, re.findall(rb'\S+', data)))
+
+
+def call(name):
+    """
+    Return a parse callable that delegates to the module's own parser.
+    """
+    return lambda module, file_path: getattr(module, name)(file_path)
+
+
+def parse_print_queue(module, file_path):
+    rules, updates = module.parse_input(file_path)
+    return module.build_rule_index(rules), updates
+
+
+def parse_disk_map(module, file_path):
+    return module.parse_disk_map(read_text(module, file_path).strip())
+
+
+def parse_machines(module, file_path):
+    lines = read_lines(module, file_path)
+    return [
+        (*module.parse_line(a), *module.parse_line(b), *module.parse_line(p))
+        for a, b, p in zip(lines[0::3], lines[1::3], lines[2::3])
+    ]
+
+
+def solve_machines(offset):
+    def solve(module, machines):
+        costs = [
+            module.solve_machine(ax, ay, bx, by, px + offset, py + offset)
+            for ax, ay, bx, by, px, py in machines
+        ]
+        return sum(cost for cost in costs if cost is not None)
+    return solve
+
+
+def parse_robots(module, file_path):
+    return [module.parse_line(line) for line in read_lines(module, file_path)]
+
+
+def solve_safety_factor(module, robots):
+    positions = module.simulate(robots, 101, 103, 100)
+    q1, q2, q3, q4 = module.count_quadrants(positions, 50, 51)
+    return q1 * q2 * q3 * q4
+
+
+def parse_warehouse(scaled):
+    def parse(module, file_path):
+        arr, moves = module.read_input(file_path)
+        if scaled:
+            arr = module.transform_map(arr)
+        return Grid.from_lines(arr.split("\n")), moves
+    return parse
+
+
+def solve_warehouse(scaled):
+    def solve(module, parsed):
+        grid, moves = parsed
+        return module.compute_gps_sum(module.simulate_moves(grid, moves, scaled), scaled)
+    return solve
+
+
+def parse_maze(module, file_path):
+    maze = module.parse_maze(file_path)
+    return (maze, *module.find_positions(maze))
+
+
+def solve_lowest_score(module, parsed):
+    _, end_min_dist, _ = module.find_lowest_scores(*parsed)
+    return end_min_dist
+
+
+def solve_best_path_tiles(module, parsed):
+    maze = parsed[0]
+    dist, _, end_states = module.find_lowest_scores(*parsed)
+    return module.count_best_path_tiles(maze, dist, end_states)
+
+
+def solve_program_output(module, parsed):
+    a, _, _, program = parsed
+    return ','.join(map(str, module.run_program(a, program)))
+
+
+def memory_size(byte_positions):
+    # The puzzle's memory space is 71x71; generated inputs may use a larger one
+    return max(71, max(max(x, y) for x, y in byte_positions) + 1)
+
+
+def solve_shortest_path(module, byte_positions):
+    grid = module.simulate_corruption(memory_size(byte_positions), byte_positions, 1024)
+    return module.bfs_shortest_path(grid)
+
+
+def solve_first_blocking_byte(module, byte_positions):
+    blocking = module.find_first_blocking_byte(memory_size(byte_positions), byte_positions)
+    return f"{blocking[0]},{blocking[1]}" if blocking else None
+
+
+def parse_race_track(module, file_path):
+    with open(file_path, 'r') as input_file:
+        return module.load_grid(input_file)
+
+
+def solve_cheats(max_cheat_length):
+    def solve(module, parsed):
+        grid, start, end = parsed
+        distances_from_start = module.compute_distances(grid, start)
+        distances_from_end = module.compute_distances(grid, end)
+        max_allowed_distance = distances_from_start[end] - 100
+        return module.find_valid_cheats(
+            grid, distances_from_start, distances_from_end, max_allowed_distance, max_cheat_length
+        )
+    return solve
+
+
+def solve_triplets(module, connections):
+    adjacency_list = module.build_adjacency_list(connections)
+    return len(module.filter_triplets_with_t(module.find_connected_triplets(adjacency_list)))
+
+
+SOLUTIONS = [
+    Solution(1, 1, 'calculate_distance', call('parse_input'),
+             lambda m, lists: m.calculate_total_distance(*lists)),
+    Solution(1, 2, 'calculate_similarity_score', call('parse_input'),
+             lambda m, lists: m.calculate_similarity_score(*lists)),
+    Solution(2, 1, 'count_safe_reports', call('parse_reports'),
+             lambda m, reports: sum(m.is_safe_report(report) for report in reports)),
+    Solution(2, 2, 'count_safe_reports_with_dampener', call('parse_reports'),
+             lambda m, reports: sum(m.check_reports_with_dampener(reports))),
+    Solution(3, 1, 'mull_it_over', read_text,
+             lambda m, memory: m.extract_and_sum_mul_instructions(memory)),
+    Solution(3, 2, 'mull_it_over_part2', read_text,
+             lambda m, memory: m.extract_and_sum_mul_with_conditions(memory)),
+    Solution(4, 1, 'ceres_search', read_grid,
+             lambda m, grid: m.count_xmas_occurrences(grid)),
+    Solution(4, 2, 'ceres_search_part2', read_grid,
+             lambda m, grid: m.count_total_x_mas(grid)),
+    Solution(5, 1, 'print_queue', parse_print_queue,
+             lambda m, parsed: sum(m.find_middle_page(update) for update in parsed[1]
+                                   if m.is_update_ordered(update, parsed[0]))),
+    Solution(5, 2, 'print_queue_part2', parse_print_queue,
+             lambda m, parsed: sum(m.find_reordered_middle_page(update, parsed[0])
+                                   for update in parsed[1]
+                                   if not m.is_update_ordered(update, parsed[0]))),
+    Solution(6, 1, 'guard_patrol', call('parse_map'),
+             lambda m, parsed: m.count_visited(m.simulate_patrol(*parsed))),
+    Solution(6, 2, 'guard_patrol_part2', call('parse_map'),
+             lambda m, parsed: len(m.find_loop_causing_positions(*parsed))),
+    Solution(7, 1, 'bridge_repair', call('parse_input'),
+             lambda m, equations: m.calculate_calibration_result(equations)),
+    Solution(7, 2, 'bridge_repair_part2', call('parse_input'),
+             lambda m, equations: m.calculate_calibration_result_with_concat(equations)),
+    Solution(8, 1, 'resonant_collinearity', call('parse_map'),
+             lambda m, parsed: len(m.calculate_antinodes(*parsed))),
+    Solution(8, 2, 'resonant_collinearity_part2', call('parse_map'),
+             lambda m, parsed: len(m.calculate_harmonic_antinodes(*parsed))),
+    Solution(9, 1, 'disk_fragmenter', parse_disk_map,
+             lambda m, parsed_map: m.calculate_checksum(m.compact_disk(parsed_map))),
+    Solution(9, 2, 'disk_fragmenter_part2', parse_disk_map,
+             lambda m, parsed_map: m.calculate_checksum(m.compact_disk_whole_files(parsed_map))),
+    Solution(10, 1, 'trailhead_scores', call('parse_map'),
+             lambda m, grid: m.calculate_total_trailhead_scores(grid)),
+    Solution(10, 2, 'hiking_trail_ratings', call('parse_map'),
+             lambda m, grid: m.calculate_total_trailhead_ratings(grid)),
+    Solution(11, 1, 'plutonian_pebbles', read_ints,
+             lambda m, stones: m.simulate_blinks_optimized(stones, 25)),
+    Solution(11, 2, 'plutonian_pebbles', read_ints,
+             lambda m, stones: m.simulate_blinks_optimized(stones, 75)),
+    Solution(12, 1, 'garden_fencing', read_grid,
+             lambda m, grid: m.calculate_total_fence_price(grid)),
+    Solution(12, 2, 'garden_fencing_part2', read_grid,
+             lambda m, grid: m.calculate_total_fence_price(grid)),
+    Solution(13, 1, 'claw_contraption_solver', parse_machines, solve_machines(0)),
+    Solution(13, 2, 'claw_contraption_solver', parse_machines, solve_machines(10000000000000)),
+    Solution(14, 1, 'restroom_redoubt', parse_robots, solve_safety_factor),
+    Solution(14, 2, 'restroom_redoubt_part2', parse_robots,
+             lambda m, robots: m.Grid(robots, 101, 103).tree_pattern()),
+    Solution(15, 1, 'warehouse_woes', parse_warehouse(False), solve_warehouse(False)),
+    Solution(15, 2, 'warehouse_woes', parse_warehouse(True), solve_warehouse(True)),
+    Solution(16, 1, 'reindeer_maze', parse_maze, solve_lowest_score),
+    Solution(16, 2, 'reindeer_maze', parse_maze, solve_best_path_tiles),
+    Solution(17, 1, 'chronospatial_computer', call('parse_input'), solve_program_output),
+    Solution(17, 2, 'chronospatial_computer', call('parse_input'),
+             lambda m, parsed: m.find_alternative_A(parsed[3])),
+    Solution(18, 1, 'ram_run', call('parse_input'), solve_shortest_path),
+    Solution(18, 2, 'ram_run_part2', call('parse_input'), solve_first_blocking_byte),
+    Solution(19, 1, 'linen_layout', call('parse_input'),
+             lambda m, parsed: m.count_possible_designs(*parsed)),
+    Solution(19, 2, 'linen_layout_part2', call('parse_input'),
+             lambda m, parsed: m.total_arrangements(*parsed)),
+    Solution(20, 1, 'race_condition', parse_race_track, solve_cheats(2)),
+    Solution(20, 2, 'race_condition', parse_race_track, solve_cheats(20)),
+    Solution(21, 1, 'keypad_conundrum', call('parse_input'),
+             lambda m, codes: m.calculate_total(codes, 2)),
+    Solution(21, 2, 'keypad_conundrum', call('parse_input'),
+             lambda m, codes: m.calculate_total(codes, 25)),
+    Solution(22, 1, 'monkey_market', read_ints,
+             lambda m, secrets: sum(m.simulate_buyer(secret) for secret in secrets)),
+    Solution(22, 2, 'monkey_market_part2', read_ints,
+             lambda m, buyers: m.simulate_and_find_best_sequence(buyers)[1]),
+    Solution(23, 1, 'lan_party', call('parse_input'), solve_triplets),
+    Solution(23, 2, 'lan_party_part2', call('parse_input'),
+             lambda m, connections: ','.join(m.find_largest_clique(connections))),
+    Solution(24, 1, 'simulate_boolean_gates', call('parse_input'),
+             lambda m, parsed: m.compute_output(m.simulate_system(*parsed))),
+    Solution(24, 2, 'simulate_boolean_gates_part2', call('read_input'),
+             lambda m, parsed: ','.join(m.simulate_system(*parsed))),
+    Solution(25, 1, 'lock_key_solver', call('parse_input'),
+             lambda m, parsed: m.count_fitting_pairs(*parsed)),
+]